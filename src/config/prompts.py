@@ -1,5 +1,6 @@
 """エージェント用のプロンプトテンプレート設定。"""
 
+import functools
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -17,10 +18,54 @@ except ImportError as e:
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def _lookup_profile_id(narrative_file: Path, username: Optional[str]) -> str:
+    """ナラティブデータCSVからprofile_idを取得する（同じファイル・ユーザーの結果はキャッシュする）。
+
+    例外はキャッシュされないため、ファイルやユーザーが見つからない場合や読み込みに失敗した場合は
+    次回の呼び出しで再度CSVを確認する（実行中に追加されたファイルやユーザーも反映される）。
+
+    Args:
+        narrative_file: ナラティブデータCSVのパス
+        username: ログイン中のユーザー名（Noneの場合は最初の1ユーザー）
+
+    Returns:
+        profile_id
+
+    Raises:
+        LookupError: ファイルまたはユーザーが存在しない場合
+    """
+    import duckdb
+
+    if not narrative_file.exists():
+        raise LookupError(f"Narrative data file not found: {narrative_file}")
+
+    # DuckDBを使用してCSVからprofile_idのみ取得
+    con = duckdb.connect()
+    try:
+        if username:
+            # usernameが指定されている場合、そのユーザーのprofile_idを取得
+            query_str = (
+                f"SELECT profile_id FROM read_csv_auto('{narrative_file}') WHERE username = ? LIMIT 1"  # noqa: S608
+            )
+            result = con.execute(query_str, [username]).fetchone()
+        else:
+            # usernameが指定されていない場合、最初の1ユーザー（後方互換性）
+            query_str = f"SELECT profile_id FROM read_csv_auto('{narrative_file}') LIMIT 1"  # noqa: S608
+            result = con.execute(query_str).fetchone()
+    finally:
+        con.close()
+
+    if not result:
+        raise LookupError(f"profile_id not found for username: {username}")
+    return str(result[0])
+
+
 def _get_current_user_profile_id(username: Optional[str] = None) -> Optional[str]:
     """現在対話中のユーザーのprofile_idのみを取得する。
 
     詳細情報（age, gender, narrative等）はget_user_profileツールで取得する。
+    現在時刻を含むプロンプト全体はキャッシュできないため、CSVの読み込み部分のみキャッシュする。
 
     Args:
         username: ログイン中のユーザー名（指定された場合、そのユーザーのprofile_idのみ取得）
@@ -28,30 +73,14 @@ def _get_current_user_profile_id(username: Optional[str] = None) -> Optional[str
     try:
         import os
 
-        import duckdb
-
         project_root = Path(__file__).parent.parent.parent
         # 環境変数からファイル名を取得（デフォルト: narrative_data.csv）
         narrative_file_name = os.getenv("NARRATIVE_DATA_FILE", "narrative_data.csv")
         narrative_file = project_root / "input" / narrative_file_name
 
-        if narrative_file.exists():
-            # DuckDBを使用してCSVからprofile_idのみ取得
-            con = duckdb.connect()
-            try:
-                if username:
-                    # usernameが指定されている場合、そのユーザーのprofile_idを取得
-                    query_str = f"SELECT profile_id FROM read_csv_auto('{narrative_file}') WHERE username = ? LIMIT 1"  # noqa: S608
-                    result = con.execute(query_str, [username]).fetchone()
-                else:
-                    # usernameが指定されていない場合、最初の1ユーザー（後方互換性）
-                    query_str = f"SELECT profile_id FROM read_csv_auto('{narrative_file}') LIMIT 1"  # noqa: S608
-                    result = con.execute(query_str).fetchone()
-
-                if result:
-                    return str(result[0])
-            finally:
-                con.close()
+        return _lookup_profile_id(narrative_file, username)
+    except LookupError:
+        return None
     except Exception as e:
         logger.warning(f"Failed to get profile_id: {e}")
     return None
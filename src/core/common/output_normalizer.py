@@ -7,6 +7,24 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 店舗ID除去パターン（より具体的なパターンを先に処理し、単体のIDは最後に除去する）
+_INTERNAL_INFO_PATTERNS: tuple[re.Pattern[str], ...] = (
+    # 店舗ID関連の説明文
+    re.compile(r"店舗ID[：:]\s*STR-\d+"),
+    re.compile(r"\(STR-\d+\)"),
+    re.compile(r"[\(\[]STR-\d+[\)\]]"),
+    # store_id フィールドが含まれる場合
+    re.compile(r'"store_id":\s*"STR-\d+"[,\s]*'),
+    re.compile(r"store_id:\s*STR-\d+[,\s]*"),
+    # 店舗ID（STR-XXXX形式）単体
+    re.compile(r"STR-\d+"),
+)
+# 2文字以上の空白、またはスペース以外の空白1文字（単一スペースは置換不要）
+_WHITESPACE_PATTERN = re.compile(r"\s{2,}|[^\S ]")
+_DOUBLE_COMMA_PATTERN = re.compile(r",\s*,")
+_TRAILING_COMMA_PATTERN = re.compile(r",\s*}")
+_LEADING_COMMA_PATTERN = re.compile(r"{\s*,")
+
 
 class OutputNormalizer:
     """エージェント出力を一貫した文字列形式に正規化する。
@@ -63,23 +81,16 @@ class OutputNormalizer:
         Returns:
             内部情報を除去したテキスト
         """
-        # 店舗ID関連の説明文を先に除去（より具体的なパターンを先に処理）
-        text = re.sub(r"店舗ID[：:]\s*STR-\d+", "", text)
-        text = re.sub(r"\(STR-\d+\)", "", text)
-        text = re.sub(r"[\(\[]STR-\d+[\)\]]", "", text)
-
-        # store_id フィールドが含まれる場合の処理
-        text = re.sub(r'"store_id":\s*"STR-\d+"[,\s]*', "", text)
-        text = re.sub(r"store_id:\s*STR-\d+[,\s]*", "", text)
-
-        # 店舗ID（STR-XXXX形式）を単体で除去（最後に処理）
-        text = re.sub(r"STR-\d+", "", text)
-
-        # 連続した空白やカンマを整理
-        text = re.sub(r"\s+", " ", text)
-        text = re.sub(r",\s*,", ",", text)
-        text = re.sub(r",\s*}", "}", text)
-        text = re.sub(r"{\s*,", "{", text)
+        # 店舗IDを含まないテキスト（ストリーミング中の大半のトークン）はID除去をスキップ
+        if "STR-" in text:
+            for pattern in _INTERNAL_INFO_PATTERNS:
+                text = pattern.sub("", text)
+
+        # 連続した空白やカンマを整理（置換対象がなければ同じ文字列オブジェクトが返る）
+        text = _WHITESPACE_PATTERN.sub(" ", text)
+        text = _DOUBLE_COMMA_PATTERN.sub(",", text)
+        text = _TRAILING_COMMA_PATTERN.sub("}", text)
+        text = _LEADING_COMMA_PATTERN.sub("{", text)
 
         return text.strip()
 
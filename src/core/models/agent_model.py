@@ -8,7 +8,10 @@ from pydantic import BaseModel, Field
 
 
 class MessageRole(str, Enum):
-    """メッセージロールの列挙型。"""
+    """メッセージロールの列挙型。
+
+    メンバーはシングルトンのため、頻繁に呼ばれる箇所では``==``ではなく``is``で比較できる。
+    """
 
     USER = "user"
     ASSISTANT = "assistant"
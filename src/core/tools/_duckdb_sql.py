@@ -0,0 +1,219 @@
+"""CSVをDuckDBに読み込んでSQLで検索するツールの共通処理。"""
+
+import functools
+import re
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import duckdb
+
+from src.core.tools.base import BaseTool
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 禁止パターン（危険なキーワード、またはセミコロン後に続く文字列による複数クエリ）を1回のmatchで検出する
+# 先頭位置の先読みを順に試すため、キーワードがセミコロンより後ろにあってもキーワードが優先される
+# キーワードは前後に単語境界があることを確認し、部分一致を避ける
+_FORBIDDEN_PATTERN = re.compile(
+    r"(?=.*?\b(?P<keyword>INSERT|UPDATE|DELETE|DROP|ALTER|CREATE|TRUNCATE|EXEC|EXECUTE|PRAGMA|ATTACH|DETACH)\b)"
+    r"|(?=.*?(?P<multiple>;\s*\S))"
+)
+# LIMIT句の検出（大文字小文字を区別しない）
+_LIMIT_PATTERN = re.compile(r"\bLIMIT\s+(\d+)\b", re.IGNORECASE)
+
+
+def _compile_csv_reference_pattern(csv_reference: str) -> re.Pattern[str]:
+    """クエリ内のCSVファイル参照を検出する正規表現を作成する。
+
+    read_csv/read_csv_autoの関数呼び出しはオプションを含めた式全体、それ以外はクォートされたファイル名に一致する。
+
+    Args:
+        csv_reference: クエリのFROM句に指定されるCSVファイル名（例: "events.csv"）
+
+    Returns:
+        CSVファイル参照に一致するコンパイル済み正規表現
+    """
+    quoted = f"""['"]{re.escape(csv_reference)}['"]"""
+    return re.compile(rf"read_csv(?:_auto)?\(\s*{quoted}[^)]*\)|{quoted}", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _apply_limit(sql_query: str) -> str:
+    """SQLクエリにLIMIT句を追加または10以下に調整する（同じクエリの結果はキャッシュする）。
+
+    キャッシュヒット時は本体が実行されないため、ログ出力は呼び出し元で行う。
+
+    Args:
+        sql_query: 元のSQLクエリ
+
+    Returns:
+        LIMIT句が調整されたSQLクエリ
+    """
+    match = _LIMIT_PATTERN.search(sql_query)
+
+    if match:
+        # 既存のLIMIT値を取得
+        current_limit = int(match.group(1))
+        if current_limit > 10:
+            # 10以下に制限
+            sql_query = _LIMIT_PATTERN.sub("LIMIT 10", sql_query)
+        return sql_query
+
+    # LIMIT句がない場合は追加
+    # セミコロンがある場合は、その前に追加
+    stripped_query = sql_query.strip()
+    if stripped_query.endswith(";"):
+        return stripped_query[:-1] + " LIMIT 10;"
+    return stripped_query + " LIMIT 10"
+
+
+class DuckDBCsvSearchTool(BaseTool):
+    """CSVをDuckDBのインメモリテーブルに読み込み、SQLクエリで検索するツールの基底クラス。
+
+    SQLの検証、LIMIT句の調整、CSV参照のテーブル名への置換、コネクションの管理を共通化する。
+    """
+
+    def __init__(
+        self,
+        csv_file: Path,
+        table_name: str,
+        csv_reference: str,
+        connection: Optional[duckdb.DuckDBPyConnection] = None,
+    ) -> None:
+        """検索ツールの共通状態を初期化する。
+
+        Args:
+            csv_file: テーブルに読み込むCSVファイルのパス
+            table_name: CSVを読み込むインメモリテーブル名
+            csv_reference: クエリのFROM句に指定されるCSVファイル名（例: "events.csv"）
+            connection: テーブルを読み込むDuckDBコネクション（省略時は初回クエリ時にインメモリで作成）
+        """
+        self._csv_file = csv_file
+        self._table_name = table_name
+        self._csv_reference_pattern = _compile_csv_reference_pattern(csv_reference)
+        # CSVを読み込んだDuckDBコネクション（初回クエリ時にテーブルを作成して使い回す）
+        self._connection: Optional[duckdb.DuckDBPyConnection] = connection
+        self._table_loaded = False
+        self._connection_lock = threading.Lock()
+
+    def _validate_sql(self, sql_query: str) -> tuple[bool, str]:
+        """SQLクエリが安全かどうかを検証する。
+
+        Args:
+            sql_query: 検証するSQLクエリ
+
+        Returns:
+            (検証成功/失敗, エラーメッセージ)のタプル
+        """
+        # 空白を正規化
+        normalized_query = " ".join(sql_query.split()).upper()
+
+        # SELECT文で始まっているかチェック
+        if not normalized_query.startswith("SELECT"):
+            return False, "SELECT文のみ実行可能です"
+
+        # 危険なキーワードと複数クエリ（セミコロン区切り）を1回でチェック（正規化済みクエリは大文字のみ）
+        # 簡易的なチェック: セミコロンの後に何かしらの文字がある場合は複数クエリとみなす
+        forbidden_match = _FORBIDDEN_PATTERN.match(normalized_query)
+        if forbidden_match:
+            if forbidden_match.group("keyword"):
+                return False, f"危険な操作が検出されました: {forbidden_match.group('keyword')}"
+            return False, "複数のクエリを同時に実行することはできません"
+
+        return True, ""
+
+    def _ensure_limit(self, sql_query: str) -> str:
+        """SQLクエリにLIMIT句を追加または調整する。
+
+        Args:
+            sql_query: 元のSQLクエリ
+
+        Returns:
+            LIMIT句が調整されたSQLクエリ
+        """
+        limited_query = _apply_limit(sql_query)
+        # キャッシュヒット時も実行されるクエリがログに残るよう、変更の有無はここで判定する
+        if limited_query != sql_query:
+            match = _LIMIT_PATTERN.search(sql_query)
+            if match:
+                logger.info(f"LIMIT adjusted from {match.group(1)} to 10")
+            else:
+                logger.info("LIMIT 10 added to query")
+        return limited_query
+
+    def _replace_csv_references(self, sql_query: str) -> str:
+        """CSVファイルへの参照を読み込み済みのテーブル名に置換する。
+
+        Args:
+            sql_query: 元のSQLクエリ
+
+        Returns:
+            CSV参照がテーブル名に置換されたSQLクエリ
+        """
+        return self._csv_reference_pattern.sub(self._table_name, sql_query)
+
+    def _get_connection(self) -> duckdb.DuckDBPyConnection:
+        """CSVを読み込んだDuckDBコネクションを取得する。
+
+        CSVの読み込みとスキーマ推定は初回のみ行い、以降のクエリでは同じテーブルを使い回す。
+        コネクションが注入されている場合は、他のツールと同じコネクションにテーブルを追加する。
+
+        Returns:
+            テーブルを保持するDuckDBコネクション
+        """
+        with self._connection_lock:
+            if self._connection is None:
+                self._connection = duckdb.connect(":memory:")
+            if not self._table_loaded:
+                # テーブル名とパスはプロジェクト内の固定値なので安全
+                query = (
+                    f"CREATE TABLE IF NOT EXISTS {self._table_name} "  # noqa: S608
+                    f"AS SELECT * FROM read_csv_auto('{self._csv_file}')"
+                )
+                cursor = self._connection.cursor()
+                try:
+                    cursor.execute(query)
+                finally:
+                    cursor.close()
+                self._table_loaded = True
+                logger.info(f"Loaded {self._table_name} data into DuckDB: {self._csv_file}")
+            return self._connection
+
+    def _execute_duckdb_query(self, sql_query: str) -> list[dict[str, Any]]:
+        """DuckDBを使用してSQLクエリを実行する。
+
+        Args:
+            sql_query: 実行するSQLクエリ
+
+        Returns:
+            クエリ結果（辞書のリスト）
+
+        Raises:
+            Exception: クエリ実行時のエラー
+        """
+        # 共有コネクションのカーソルはスレッドごとに独立して使える
+        cursor = self._get_connection().cursor()
+        try:
+            # クエリ実行
+            result = cursor.execute(sql_query).fetchall()
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+
+            # 結果を辞書のリストに変換
+            results = []
+            for row in result:
+                row_dict = {}
+                for i, column in enumerate(columns):
+                    value = row[i]
+                    # datetimeオブジェクトを文字列に変換
+                    if hasattr(value, "isoformat"):
+                        value = value.isoformat()
+                    row_dict[column] = value
+                results.append(row_dict)
+
+            return results
+
+        finally:
+            # カーソルをクローズ（共有コネクションは保持する）
+            cursor.close()
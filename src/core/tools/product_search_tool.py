@@ -1,24 +1,30 @@
 """商品データをSQLで検索するツール。"""
 
-import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import duckdb
 
-from src.core.tools.base import BaseTool
+from src.core.tools._duckdb_sql import DuckDBCsvSearchTool
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class ProductSearchTool(BaseTool):
+class ProductSearchTool(DuckDBCsvSearchTool):
     """商品データをSQLクエリで検索するツール。"""
 
-    def __init__(self) -> None:
-        """商品検索ツールを初期化する。"""
+    def __init__(self, connection: Optional[duckdb.DuckDBPyConnection] = None) -> None:
+        """商品検索ツールを初期化する。
+
+        Args:
+            connection: テーブルを読み込むDuckDBコネクション（省略時は初回クエリ時にインメモリで作成）
+        """
         self.project_root = Path(__file__).parent.parent.parent.parent
         self.products_file = self.project_root / "input" / "filtered_product_data.csv"
+        super().__init__(
+            self.products_file, table_name="products", csv_reference="filtered_product_data.csv", connection=connection
+        )
 
     @property
     def name(self) -> str:
@@ -106,10 +112,8 @@ class ProductSearchTool(BaseTool):
             # LIMIT句の調整
             sql_query = self._ensure_limit(sql_query)
 
-            # filtered_product_data.csvへのパスを実際のファイルパスに置換
-            sql_query = sql_query.replace("'filtered_product_data.csv'", f"'{self.products_file}'")
-            sql_query = sql_query.replace('"filtered_product_data.csv"', f"'{self.products_file}'")
-            sql_query = sql_query.replace("read_csv('filtered_product_data.csv')", f"read_csv('{self.products_file}')")
+            # filtered_product_data.csvへの参照を読み込み済みのテーブルに置換
+            sql_query = self._replace_csv_references(sql_query)
 
             # DuckDBでクエリ実行
             results = self._execute_duckdb_query(sql_query)
@@ -121,121 +125,3 @@ class ProductSearchTool(BaseTool):
             error_msg = f"クエリ実行中にエラーが発生しました: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
-
-    def _validate_sql(self, sql_query: str) -> tuple[bool, str]:
-        """SQLクエリが安全かどうかを検証する。
-
-        Args:
-            sql_query: 検証するSQLクエリ
-
-        Returns:
-            (検証成功/失敗, エラーメッセージ)のタプル
-        """
-        # 空白を正規化
-        normalized_query = " ".join(sql_query.split()).upper()
-
-        # SELECT文で始まっているかチェック
-        if not normalized_query.startswith("SELECT"):
-            return False, "SELECT文のみ実行可能です"
-
-        # 危険なキーワードのチェック
-        dangerous_keywords = [
-            "INSERT",
-            "UPDATE",
-            "DELETE",
-            "DROP",
-            "ALTER",
-            "CREATE",
-            "TRUNCATE",
-            "EXEC",
-            "EXECUTE",
-            "PRAGMA",
-            "ATTACH",
-            "DETACH",
-        ]
-
-        for keyword in dangerous_keywords:
-            # キーワードの前後に単語境界があることを確認（部分一致を避ける）
-            pattern = r"\b" + keyword + r"\b"
-            if re.search(pattern, normalized_query):
-                return False, f"危険な操作が検出されました: {keyword}"
-
-        # 複数クエリのチェック（セミコロン区切り）
-        # ただし、文字列リテラル内のセミコロンは除外
-        # 簡易的なチェック: セミコロンの後に何かしらの文字がある場合
-        semicolon_pattern = r";[\s\S]+\S"
-        if re.search(semicolon_pattern, sql_query.strip()):
-            return False, "複数のクエリを同時に実行することはできません"
-
-        return True, ""
-
-    def _ensure_limit(self, sql_query: str) -> str:
-        """SQLクエリにLIMIT句を追加または調整する。
-
-        Args:
-            sql_query: 元のSQLクエリ
-
-        Returns:
-            LIMIT句が調整されたSQLクエリ
-        """
-        # LIMIT句の検出（大文字小文字を区別しない）
-        limit_pattern = r"\bLIMIT\s+(\d+)\b"
-        match = re.search(limit_pattern, sql_query, re.IGNORECASE)
-
-        if match:
-            # 既存のLIMIT値を取得
-            current_limit = int(match.group(1))
-            if current_limit > 10:
-                # 10以下に制限
-                sql_query = re.sub(limit_pattern, "LIMIT 10", sql_query, flags=re.IGNORECASE)
-                logger.info(f"LIMIT adjusted from {current_limit} to 10")
-        else:
-            # LIMIT句がない場合は追加
-            # セミコロンがある場合は、その前に追加
-            if sql_query.strip().endswith(";"):
-                sql_query = sql_query.strip()[:-1] + " LIMIT 10;"
-            else:
-                sql_query = sql_query.strip() + " LIMIT 10"
-            logger.info("LIMIT 10 added to query")
-
-        return sql_query
-
-    def _execute_duckdb_query(self, sql_query: str) -> list[dict[str, Any]]:
-        """DuckDBを使用してSQLクエリを実行する。
-
-        Args:
-            sql_query: 実行するSQLクエリ
-
-        Returns:
-            クエリ結果（辞書のリスト）
-
-        Raises:
-            Exception: クエリ実行時のエラー
-        """
-        con = None
-        try:
-            # インメモリDuckDBコネクション作成
-            con = duckdb.connect()
-
-            # クエリ実行
-            result = con.execute(sql_query).fetchall()
-            columns = [desc[0] for desc in con.description] if con.description else []
-
-            # 結果を辞書のリストに変換
-            results = []
-            for row in result:
-                row_dict = {}
-                for i, column in enumerate(columns):
-                    value = row[i]
-                    # datetimeオブジェクトを文字列に変換
-                    if hasattr(value, "isoformat"):
-                        value = value.isoformat()
-                    row_dict[column] = value
-                results.append(row_dict)
-
-            return results
-
-        finally:
-            # コネクションをクローズ
-            if con:
-                con.close()
@@ -1,25 +1,31 @@
 """店舗データをSQLで検索するツール。"""
 
-import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import duckdb
 
-from src.core.tools.base import BaseTool
+from src.core.tools._duckdb_sql import DuckDBCsvSearchTool
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class StoreSearchTool(BaseTool):
+class StoreSearchTool(DuckDBCsvSearchTool):
     """店舗データをSQLクエリで検索するツール。"""
 
-    def __init__(self) -> None:
-        """店舗検索ツールを初期化する。"""
+    def __init__(self, connection: Optional[duckdb.DuckDBPyConnection] = None) -> None:
+        """店舗検索ツールを初期化する。
+
+        Args:
+            connection: テーブルを読み込むDuckDBコネクション（省略時は初回クエリ時にインメモリで作成）
+        """
         self.project_root = Path(__file__).parent.parent.parent.parent
         self.stores_file = self.project_root / "input" / "filtered_store_data_カテゴリー情報あり.csv"
         self.stores_url_file = self.project_root / "input" / "stores.csv"
+        super().__init__(self.stores_file, table_name="stores", csv_reference="stores.csv", connection=connection)
+        # store_idをキーとした店舗URLの辞書（初回読み込み成功時にキャッシュする）
+        self._store_urls: Optional[dict[str, str]] = None
 
     @property
     def name(self) -> str:
@@ -138,10 +144,8 @@ class StoreSearchTool(BaseTool):
             # LIMIT句の調整
             sql_query = self._ensure_limit(sql_query)
 
-            # stores.csvへのパスを実際のファイルパスに置換
-            sql_query = sql_query.replace("'stores.csv'", f"'{self.stores_file}'")
-            sql_query = sql_query.replace('"stores.csv"', f"'{self.stores_file}'")
-            sql_query = sql_query.replace("read_csv('stores.csv')", f"read_csv('{self.stores_file}')")
+            # stores.csvへの参照を読み込み済みのテーブルに置換
+            sql_query = self._replace_csv_references(sql_query)
 
             # DuckDBでクエリ実行
             results = self._execute_duckdb_query(sql_query)
@@ -165,123 +169,27 @@ class StoreSearchTool(BaseTool):
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def _validate_sql(self, sql_query: str) -> tuple[bool, str]:
-        """SQLクエリが安全かどうかを検証する。
-
-        Args:
-            sql_query: 検証するSQLクエリ
-
-        Returns:
-            (検証成功/失敗, エラーメッセージ)のタプル
-        """
-        # 空白を正規化
-        normalized_query = " ".join(sql_query.split()).upper()
-
-        # SELECT文で始まっているかチェック
-        if not normalized_query.startswith("SELECT"):
-            return False, "SELECT文のみ実行可能です"
-
-        # 危険なキーワードのチェック
-        dangerous_keywords = [
-            "INSERT",
-            "UPDATE",
-            "DELETE",
-            "DROP",
-            "ALTER",
-            "CREATE",
-            "TRUNCATE",
-            "EXEC",
-            "EXECUTE",
-            "PRAGMA",
-            "ATTACH",
-            "DETACH",
-        ]
-
-        for keyword in dangerous_keywords:
-            # キーワードの前後に単語境界があることを確認（部分一致を避ける）
-            pattern = r"\b" + keyword + r"\b"
-            if re.search(pattern, normalized_query):
-                return False, f"危険な操作が検出されました: {keyword}"
-
-        # 複数クエリのチェック（セミコロン区切り）
-        # ただし、文字列リテラル内のセミコロンは除外
-        # 簡易的なチェック: セミコロンの後に何かしらの文字がある場合
-        semicolon_pattern = r";[\s\S]+\S"
-        if re.search(semicolon_pattern, sql_query.strip()):
-            return False, "複数のクエリを同時に実行することはできません"
-
-        return True, ""
-
-    def _ensure_limit(self, sql_query: str) -> str:
-        """SQLクエリにLIMIT句を追加または調整する。
-
-        Args:
-            sql_query: 元のSQLクエリ
-
-        Returns:
-            LIMIT句が調整されたSQLクエリ
-        """
-        # LIMIT句の検出（大文字小文字を区別しない）
-        limit_pattern = r"\bLIMIT\s+(\d+)\b"
-        match = re.search(limit_pattern, sql_query, re.IGNORECASE)
-
-        if match:
-            # 既存のLIMIT値を取得
-            current_limit = int(match.group(1))
-            if current_limit > 10:
-                # 10以下に制限
-                sql_query = re.sub(limit_pattern, "LIMIT 10", sql_query, flags=re.IGNORECASE)
-                logger.info(f"LIMIT adjusted from {current_limit} to 10")
-        else:
-            # LIMIT句がない場合は追加
-            # セミコロンがある場合は、その前に追加
-            if sql_query.strip().endswith(";"):
-                sql_query = sql_query.strip()[:-1] + " LIMIT 10;"
-            else:
-                sql_query = sql_query.strip() + " LIMIT 10"
-            logger.info("LIMIT 10 added to query")
-
-        return sql_query
-
-    def _execute_duckdb_query(self, sql_query: str) -> list[dict[str, Any]]:
-        """DuckDBを使用してSQLクエリを実行する。
-
-        Args:
-            sql_query: 実行するSQLクエリ
+    def _load_store_urls(self) -> dict[str, str]:
+        """stores.csvから店舗URLの辞書を読み込む（初回のみ読み込み、以降はキャッシュを返す）。
 
         Returns:
-            クエリ結果（辞書のリスト）
+            store_idをキーとした店舗URLの辞書
 
         Raises:
-            Exception: クエリ実行時のエラー
+            Exception: ファイル読み込みやクエリ実行時のエラー
         """
-        con = None
-        try:
-            # インメモリDuckDBコネクション作成
-            con = duckdb.connect()
-
-            # クエリ実行
-            result = con.execute(sql_query).fetchall()
-            columns = [desc[0] for desc in con.description] if con.description else []
-
-            # 結果を辞書のリストに変換
-            results = []
-            for row in result:
-                row_dict = {}
-                for i, column in enumerate(columns):
-                    value = row[i]
-                    # datetimeオブジェクトを文字列に変換
-                    if hasattr(value, "isoformat"):
-                        value = value.isoformat()
-                    row_dict[column] = value
-                results.append(row_dict)
-
-            return results
+        if self._store_urls is None:
+            # パスはプロジェクト内の固定パスなので安全
+            query = f"SELECT store_id, source FROM read_csv_auto('{str(self.stores_url_file)}')"  # noqa: S608
+            cursor = self._get_connection().cursor()
+            try:
+                url_data = cursor.execute(query).fetchall()
+            finally:
+                cursor.close()
 
-        finally:
-            # コネクションをクローズ
-            if con:
-                con.close()
+            # store_idをキーとした辞書を作成
+            self._store_urls = {row[0]: row[1] for row in url_data if row[1]}  # URLが空でないもののみ
+        return self._store_urls
 
     def _add_store_urls(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """検索結果に店舗URLを追加する。
@@ -293,15 +201,7 @@ class StoreSearchTool(BaseTool):
             URL情報が追加された検索結果のリスト
         """
         try:
-            # stores.csvからURL情報を読み込む
-            con = duckdb.connect()
-            # パスはプロジェクト内の固定パスなので安全
-            query = f"SELECT store_id, source FROM read_csv_auto('{str(self.stores_url_file)}')"  # noqa: S608
-            url_data = con.execute(query).fetchall()
-            con.close()
-
-            # store_idをキーとした辞書を作成
-            url_dict = {row[0]: row[1] for row in url_data if row[1]}  # URLが空でないもののみ
+            url_dict = self._load_store_urls()
 
             # 各結果にURLを追加
             for result in results:
@@ -26,6 +26,8 @@ class UserProfileTool(BaseTool):
         narrative_file_name = os.getenv("NARRATIVE_DATA_FILE", "narrative_data.csv")
         self.narrative_file = self.project_root / "input" / narrative_file_name
         self.username = username
+        # 取得済みのプロファイル（CSVは実行中に変わらないため、ユーザーごとに一度だけ読み込む）
+        self._cached_profile: Optional[dict[str, Any]] = None
 
     @property
     def name(self) -> str:
@@ -97,16 +99,20 @@ class UserProfileTool(BaseTool):
             return {"error": "ログイン情報が見つかりません。ログインしてください。"}
 
         try:
-            # usernameを使ってナラティブデータを取得
-            result = self._fetch_user_profile_by_username()
+            if self._cached_profile is None:
+                # usernameを使ってナラティブデータを取得
+                result = self._fetch_user_profile_by_username()
 
-            if not result:
-                error_msg = f"ユーザー情報が見つかりません: {self.username}"
-                logger.warning(error_msg)
-                return {"error": error_msg}
+                if not result:
+                    error_msg = f"ユーザー情報が見つかりません: {self.username}"
+                    logger.warning(error_msg)
+                    return {"error": error_msg}
 
-            logger.info(f"Successfully fetched profile for user: {self.username}")
-            return result
+                self._cached_profile = result
+                logger.info(f"Successfully fetched profile for user: {self.username}")
+
+            # 呼び出し側での変更がキャッシュに影響しないようコピーを返す
+            return dict(self._cached_profile)
 
         except Exception as e:
             error_msg = f"プロファイル情報の取得に失敗しました: {str(e)}"
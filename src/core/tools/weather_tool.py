@@ -1,7 +1,10 @@
 """天気情報取得ツール。"""
 
+import re
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 import requests  # type: ignore
 
 from src.core.tools.base import BaseTool
@@ -9,14 +12,33 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 天気テキストの置換ルール（「から」「後」は「のち」に統一）
+_WEATHER_REPLACEMENTS = {
+    "くもり": "曇り",
+    "はれ": "晴れ",
+    "から": "のち",
+    "後": "のち",
+}
+# 置換ルールのキーを1回の走査で置換するための正規表現
+_WEATHER_REPLACEMENT_PATTERN = re.compile("|".join(map(re.escape, _WEATHER_REPLACEMENTS)))
+# 複数の空白・全角スペース
+_WHITESPACE_PATTERN = re.compile(r"[\s\u3000]+")
+# 削除する時間帯キーワード
+_TIME_KEYWORDS = frozenset(["朝", "昼", "夕方", "夜", "昼前", "昼過ぎ", "明け方", "所により", "ところにより"])
+
+# 対応地域と地域コードのマッピング（読み取り専用）
+_AREA_CODES = MappingProxyType(
+    {
+        "東京": "130000",
+    }
+)
+
 
 class WeatherTool(BaseTool):
     """気象庁APIから天気予報を取得するツール。"""
 
     # 対応地域と地域コードのマッピング
-    AREA_CODES = {
-        "東京": "130000",
-    }
+    AREA_CODES = _AREA_CODES
 
     API_BASE_URL = "https://www.jma.go.jp/bosai/forecast/data/forecast"
     TIMEOUT = 10  # APIリクエストのタイムアウト（秒）
@@ -107,7 +129,7 @@ class WeatherTool(BaseTool):
             area_code: 地域コード
 
         Returns:
-            APIレスポンスのJSON（辞書またはリスト）
+            APIレスポンスのJSON（辞書またはリスト、バイト列から直接デコードする）
 
         Raises:
             Exception: API呼び出しに失敗した場合
@@ -118,11 +140,13 @@ class WeatherTool(BaseTool):
         try:
             response = requests.get(url, timeout=self.TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.Timeout as e:
             raise Exception("気象庁APIへの接続がタイムアウトしました") from e
         except requests.exceptions.RequestException as e:
             raise Exception(f"気象庁APIへの接続に失敗しました: {str(e)}") from e
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"気象庁APIのレスポンスの解析に失敗しました: {str(e)}") from e
 
     def _parse_weather_info(self, data: Any, location: str, area_code: str) -> dict[str, Any]:
         """APIレスポンスから天気情報を抽出・整形する。
@@ -249,27 +273,17 @@ class WeatherTool(BaseTool):
         if not weather:
             return ""
 
-        import re
-
-        # 基本的な置換ルール
-        weather = weather.replace("くもり", "曇り")
-        weather = weather.replace("はれ", "晴れ")
+        # 基本的な置換と「から」「後」→「のち」の置換
+        weather = _WEATHER_REPLACEMENT_PATTERN.sub(lambda m: _WEATHER_REPLACEMENTS[m.group(0)], weather)
 
         # 複数の空白・全角スペースを1つの空白に
-        weather = re.sub(r"[\s\u3000]+", " ", weather)
-
-        # 時間帯キーワード
-        time_keywords = ["朝", "昼", "夕方", "夜", "昼前", "昼過ぎ", "明け方", "所により", "ところにより"]
-
-        # 「から」「後」を「のち」に置換
-        weather = weather.replace("から", "のち")
-        weather = weather.replace("後", "のち")
+        weather = _WHITESPACE_PATTERN.sub(" ", weather)
 
         # スペースで分割
         parts = weather.split()
 
         # 時間帯キーワードを削除
-        filtered_parts = [p for p in parts if p not in time_keywords]
+        filtered_parts = [p for p in parts if p not in _TIME_KEYWORDS]
 
         # 天気の主要部分を抽出
         if len(filtered_parts) == 0:
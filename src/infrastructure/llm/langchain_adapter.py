@@ -1,6 +1,7 @@
 """LLM統合用のLangChainフレームワークアダプター。"""
 
 import json
+import re
 from collections.abc import AsyncIterator
 from typing import Any, Optional
 
@@ -15,6 +16,9 @@ except ImportError as e:
 
 logger = get_logger(__name__)
 
+# JSONのネスト深さの追跡に必要な文字（文字列内のエスケープ、引用符、波括弧）
+_JSON_STRUCTURE_PATTERN = re.compile(r'[\\"{}]')
+
 
 class LangChainAdapter:
     """LangChainフレームワーク統合用のアダプター。
@@ -102,9 +106,53 @@ class LangChainAdapter:
             tool_calls_map[tool_call_id] = {
                 "tool_name": tool_name or "unknown",
                 "tool_input": tool_args,
-                "accumulated_json": "",  # JSONデルタを蓄積（Claude/OpenAI共通）
+                "json_fragments": [],  # JSONデルタを蓄積（Claude/OpenAI共通）
+                "json_depth": 0,  # 蓄積済みJSONの波括弧のネスト深さ
+                "json_in_string": False,  # 蓄積済みJSONが文字列リテラルの途中かどうか
+                "json_escaped": False,  # 次の断片の先頭文字がエスケープされているかどうか
             }
 
+    def _track_json_depth(self, tool_call_info: dict[str, Any], json_fragment: str) -> bool:
+        """JSON断片を走査してネスト深さを更新し、トップレベルのオブジェクトが閉じたかを返す。
+
+        文字列リテラル内の波括弧やエスケープされた引用符は数えない。
+
+        Args:
+            tool_call_info: ツール呼び出し情報
+            json_fragment: 追加されたJSON断片
+
+        Returns:
+            この断片でネスト深さが0に戻った場合はTrue
+        """
+        depth = tool_call_info["json_depth"]
+        in_string = tool_call_info["json_in_string"]
+        # 前の断片が"\"で終わっていた場合は先頭文字がエスケープされている
+        escaped_pos = 0 if tool_call_info["json_escaped"] else -1
+        closed = False
+
+        for match in _JSON_STRUCTURE_PATTERN.finditer(json_fragment):
+            pos = match.start()
+            if pos == escaped_pos:
+                continue
+            char = match.group()
+            if in_string:
+                if char == "\\":
+                    escaped_pos = pos + 1
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                closed = depth == 0
+
+        tool_call_info["json_depth"] = depth
+        tool_call_info["json_in_string"] = in_string
+        tool_call_info["json_escaped"] = escaped_pos == len(json_fragment)
+        return closed and depth == 0
+
     def _extract_json_fragment(self, chunk: Any, index_to_id_map: dict[int, str]) -> tuple[str, str]:
         """チャンクからJSON断片とtool_call_idを抽出する統一メソッド。
 
@@ -117,22 +165,23 @@ class LangChainAdapter:
         Returns:
             (json_fragment, tool_call_id)のタプル
         """
+        # トークンごとに呼ばれるため、属性は1回ずつだけ取得する
         # Claude形式: input_json_deltaをチェック
-        if isinstance(getattr(chunk, "content", None), list):
-            for item in chunk.content:
-                if isinstance(item, dict) and item.get("type") == "input_json_delta":
-                    partial_json = item.get("partial_json", "")
+        content = getattr(chunk, "content", None)
+        if isinstance(content, list):
+            for item in content:
+                if type(item) is dict and item.get("type") == "input_json_delta":
                     # tool_call_idは最後に登録されたもの（後で解決）
-                    return partial_json, ""
+                    return item.get("partial_json", ""), ""
 
         # OpenAI形式: tool_call_chunksをチェック
-        if hasattr(chunk, "tool_call_chunks") and chunk.tool_call_chunks:
-            for tcc in chunk.tool_call_chunks:
-                if not isinstance(tcc, dict):
+        tool_call_chunks = getattr(chunk, "tool_call_chunks", None)
+        if tool_call_chunks:
+            for tcc in tool_call_chunks:
+                if type(tcc) is not dict:
                     continue
 
                 tool_call_id = tcc.get("id")
-                tcc.get("name")
                 args = tcc.get("args", "")
                 index = tcc.get("index", 0)
 
@@ -172,13 +221,23 @@ class LangChainAdapter:
             tool_call_id = list(tool_calls_map.keys())[-1]
 
         if tool_call_id and tool_call_id in tool_calls_map:
-            # JSON断片を蓄積
-            tool_calls_map[tool_call_id]["accumulated_json"] += json_fragment
+            tool_call_info = tool_calls_map[tool_call_id]
+
+            # JSON断片はリストに溜め、パースするときにだけ結合する
+            # （断片ごとに str += すると蓄積済みのバッファ全体を毎回コピーすることになる）
+            tool_call_info["json_fragments"].append(json_fragment)
+
+            # ツール入力はJSONオブジェクトのため、トップレベルの波括弧が閉じるまでは完全なJSONになり得ない
+            # （断片ごとに全体をパースし直すと断片数に対して二乗のコストになる）
+            if not self._track_json_depth(tool_call_info, json_fragment):
+                return
+
+            accumulated_json = "".join(tool_call_info["json_fragments"])
 
             # パースを試みる
             try:
-                parsed_input = json.loads(tool_calls_map[tool_call_id]["accumulated_json"])
-                tool_calls_map[tool_call_id]["tool_input"] = parsed_input
+                parsed_input = json.loads(accumulated_json)
+                tool_call_info["tool_input"] = parsed_input
                 logger.debug(f"Parsed tool_input from JSON fragment for {tool_call_id}: {parsed_input}")
             except json.JSONDecodeError:
                 # まだ完全なJSONではない
@@ -30,7 +30,7 @@ def _should_reset_session(selected_model: str) -> bool:
         セッションをリセットすべきならTrue
     """
     # モデルが変更された場合はリセット
-    if "current_model" not in st.session_state or st.session_state.current_model != selected_model:
+    if st.session_state.get("current_model") != selected_model:
         return True
 
     # ログインユーザーが切り替わった場合もリセット（プライバシー保護）
@@ -79,11 +79,8 @@ def initialize_session_state(selected_model: str) -> None:
         st.session_state.current_session_id = str(uuid.uuid4())
         logger.info(f"新しいセッションを作成: {st.session_state.current_session_id}")
 
-    if "chat_messages" not in st.session_state:
-        st.session_state.chat_messages = []
-
-    if "is_processing" not in st.session_state:
-        st.session_state.is_processing = False
+    st.session_state.setdefault("chat_messages", [])
+    st.session_state.setdefault("is_processing", False)
 
     # previous_usernameを初期化（初回ログイン時）
     if "previous_username" not in st.session_state:
@@ -1,7 +1,9 @@
 """LangChainAdapterの統一ツール入力処理のテスト。"""
 
+import json
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -17,6 +19,13 @@ def create_mock_claude_chunk(tool_call_id: str, tool_name: str, partial_json: st
     return chunk
 
 
+def create_tool_calls_map(adapter: LangChainAdapter, tool_call_id: str, tool_name: str) -> dict[str, dict[str, Any]]:
+    """アダプターと同じ初期状態のツール呼び出し情報マップを作成する。"""
+    tool_calls_map: dict[str, dict[str, Any]] = {}
+    adapter._update_tool_call_info(tool_calls_map, tool_call_id, tool_name, {})
+    return tool_calls_map
+
+
 def create_mock_openai_chunk(
     tool_call_id: str | None,
     tool_name: str | None,
@@ -64,9 +73,7 @@ class TestLangChainAdapterUnified:
 
     def test_process_tool_input_streaming_claude(self, adapter: LangChainAdapter) -> None:
         """Claude形式のストリーミングを統一メソッドで処理できることを確認する。"""
-        tool_calls_map: dict[str, dict[str, Any]] = {
-            "call_123": {"tool_name": "test_tool", "tool_input": {}, "accumulated_json": ""}
-        }
+        tool_calls_map = create_tool_calls_map(adapter, "call_123", "test_tool")
         index_to_id_map: dict[int, str] = {}
 
         # 3つのチャンクに分割されたJSONを処理
@@ -81,13 +88,11 @@ class TestLangChainAdapterUnified:
 
         # 最終的に完全なJSONがパースされている
         assert tool_calls_map["call_123"]["tool_input"] == {"location": "Tokyo"}
-        assert tool_calls_map["call_123"]["accumulated_json"] == '{"location": "Tokyo"}'
+        assert "".join(tool_calls_map["call_123"]["json_fragments"]) == '{"location": "Tokyo"}'
 
     def test_process_tool_input_streaming_openai(self, adapter: LangChainAdapter) -> None:
         """OpenAI形式のストリーミングを統一メソッドで処理できることを確認する。"""
-        tool_calls_map: dict[str, dict[str, Any]] = {
-            "call_456": {"tool_name": "test_tool", "tool_input": {}, "accumulated_json": ""}
-        }
+        tool_calls_map = create_tool_calls_map(adapter, "call_456", "test_tool")
         index_to_id_map: dict[int, str] = {}
 
         # 3つのチャンクに分割されたJSONを処理
@@ -102,14 +107,48 @@ class TestLangChainAdapterUnified:
 
         # 最終的に完全なJSONがパースされている
         assert tool_calls_map["call_456"]["tool_input"] == {"location": "Tokyo"}
-        assert tool_calls_map["call_456"]["accumulated_json"] == '{"location": "Tokyo"}'
+        assert "".join(tool_calls_map["call_456"]["json_fragments"]) == '{"location": "Tokyo"}'
+
+    def test_process_tool_input_streaming_parses_only_closed_objects(self, adapter: LangChainAdapter) -> None:
+        """トップレベルのオブジェクトが閉じるまではJSONパースを試みないことを確認する。"""
+        tool_calls_map = create_tool_calls_map(adapter, "call_123", "test_tool")
+        index_to_id_map: dict[int, str] = {}
+        chunks = [
+            create_mock_claude_chunk("call_123", "test_tool", '{"filters": {"area"'),
+            create_mock_claude_chunk("call_123", "test_tool", ': "麻布台"}'),
+            create_mock_claude_chunk("call_123", "test_tool", ', "limit": 5'),
+            create_mock_claude_chunk("call_123", "test_tool", "}"),
+        ]
+
+        with patch("src.infrastructure.llm.langchain_adapter.json.loads", wraps=json.loads) as mock_loads:
+            for chunk in chunks:
+                adapter._process_tool_input_streaming(tool_calls_map, index_to_id_map, chunk)
+
+        # ネストしたオブジェクトが閉じた時点ではパースせず、最後の断片で1回だけパースされる
+        assert mock_loads.call_count == 1
+        assert tool_calls_map["call_123"]["tool_input"] == {"filters": {"area": "麻布台"}, "limit": 5}
+
+    def test_process_tool_input_streaming_ignores_braces_in_strings(self, adapter: LangChainAdapter) -> None:
+        """文字列内の波括弧やエスケープされた引用符（断片の境界をまたぐものを含む）を数えないことを確認する。"""
+        tool_calls_map = create_tool_calls_map(adapter, "call_123", "test_tool")
+        index_to_id_map: dict[int, str] = {}
+        chunks = [
+            create_mock_claude_chunk("call_123", "test_tool", '{"q": "}{ \\'),
+            create_mock_claude_chunk("call_123", "test_tool", '"}" '),
+            create_mock_claude_chunk("call_123", "test_tool", "}"),
+        ]
+
+        with patch("src.infrastructure.llm.langchain_adapter.json.loads", wraps=json.loads) as mock_loads:
+            for chunk in chunks:
+                adapter._process_tool_input_streaming(tool_calls_map, index_to_id_map, chunk)
+
+        assert mock_loads.call_count == 1
+        assert tool_calls_map["call_123"]["tool_input"] == {"q": '}{ "}'}
 
     def test_unified_processing_produces_same_result(self, adapter: LangChainAdapter) -> None:
         """Claude/OpenAI両方で同じ結果が得られることを確認する。"""
         # Claude形式の処理
-        claude_map: dict[str, dict[str, Any]] = {
-            "call_1": {"tool_name": "calculate", "tool_input": {}, "accumulated_json": ""}
-        }
+        claude_map = create_tool_calls_map(adapter, "call_1", "calculate")
         claude_index_map: dict[int, str] = {}
         claude_chunks = [
             create_mock_claude_chunk("call_1", "calculate", '{"a": 5,'),
@@ -119,9 +158,7 @@ class TestLangChainAdapterUnified:
             adapter._process_tool_input_streaming(claude_map, claude_index_map, chunk)
 
         # OpenAI形式の処理
-        openai_map: dict[str, dict[str, Any]] = {
-            "call_2": {"tool_name": "calculate", "tool_input": {}, "accumulated_json": ""}
-        }
+        openai_map = create_tool_calls_map(adapter, "call_2", "calculate")
         openai_index_map: dict[int, str] = {}
         openai_chunks = [
             create_mock_openai_chunk("call_2", "calculate", '{"a": 5,', 0),
@@ -133,3 +170,28 @@ class TestLangChainAdapterUnified:
         # 両方とも同じtool_inputを得る
         assert claude_map["call_1"]["tool_input"] == openai_map["call_2"]["tool_input"]
         assert claude_map["call_1"]["tool_input"] == {"a": 5, "b": 3}
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("fragment_count", [1000, 4000])
+def test_tool_input_streaming_scales_linearly(fragment_count: int) -> None:
+    """ツール入力の蓄積処理が断片数に対して二乗のコストにならないことを確認する。
+
+    実行時間ではなく、JSONパースの回数とパースした文字数で計算量を検証する。
+    断片ごとにバッファ全体をパースし直すような実装に戻ると、断片数に比例してパース回数が増える。
+    オブジェクトの配列のように多くの断片が"}"で終わる入力でも、パースは最後の1回だけになる。
+    """
+    adapter = LangChainAdapter(llm=MagicMock(), tools=[])
+    fragments = ['{"items": [', *(['{"id": 1}, '] * fragment_count), '{"id": 1}]}']
+    chunks = [SimpleNamespace(content=[{"type": "input_json_delta", "partial_json": f}]) for f in fragments]
+    tool_calls_map = create_tool_calls_map(adapter, "call_1", "test_tool")
+
+    with patch("src.infrastructure.llm.langchain_adapter.json.loads", wraps=json.loads) as mock_loads:
+        for chunk in chunks:
+            adapter._process_tool_input_streaming(tool_calls_map, {}, chunk)
+
+    assert tool_calls_map["call_1"]["tool_input"] == {"items": [{"id": 1}] * (fragment_count + 1)}
+    # 完全なJSONになった時点で1回だけ、蓄積済みの入力全体をパースする
+    assert mock_loads.call_count == 1
+    parsed_chars = sum(len(call.args[0]) for call in mock_loads.call_args_list)
+    assert parsed_chars == len("".join(fragments))
@@ -5,41 +5,76 @@ ClaudeとOpenAI APIのツール入力ストリーミング実装の違いを確
 """
 
 import json
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjsonが無い環境では標準ライブラリにフォールバック
+    _loads = json.loads
+
+# ストリーミング判定に使うキー。==は同一オブジェクトなら文字比較を省略するため、internしておく
+_DELTA_TYPE = sys.intern("input_json_delta")
+_PARTIAL_KEY = sys.intern("partial_json")
+_ARGS_KEY = sys.intern("args")
+
+
 # --- モックデータの定義 ---
 
 
+class ClaudeChunk:
+    """Claude形式のAIメッセージチャンクのモック。"""
+
+    __slots__ = ("type", "content", "tool_calls")
+
+    def __init__(self, content: list[dict[str, Any]], tool_calls: list[dict[str, Any]]) -> None:
+        self.type = "AIMessageChunk"
+        self.content = content
+        self.tool_calls = tool_calls
+
+
+class OpenAIChunk:
+    """OpenAI形式のAIメッセージチャンクのモック。"""
+
+    __slots__ = ("type", "content", "tool_call_chunks")
+
+    def __init__(self, tool_call_chunks: list[dict[str, Any]]) -> None:
+        self.type = "AIMessageChunk"
+        self.content = ""
+        self.tool_call_chunks = tool_call_chunks
+
+
+class ToolChunk:
+    """ツール実行結果のメッセージチャンクのモック（両API共通）。"""
+
+    __slots__ = ("type", "content", "tool_call_id", "name")
+
+    def __init__(self, tool_call_id: str, tool_name: str, output: str) -> None:
+        self.type = "tool"
+        self.content = output
+        self.tool_call_id = tool_call_id
+        self.name = tool_name
+
+
 def create_claude_tool_call_chunk(
     tool_call_id: str,
     tool_name: str,
     partial_json: str,
-) -> Any:
+) -> ClaudeChunk:
     """Claude形式のツール呼び出しチャンクを作成する。
 
     Claudeは`input_json_delta`として部分的なJSONを送信する。
     """
-
-    class ClaudeChunk:
-        def __init__(self) -> None:
-            self.type = "AIMessageChunk"
-            self.content = [
-                {
-                    "type": "input_json_delta",
-                    "partial_json": partial_json,
-                }
-            ]
-            self.tool_calls = [
-                {
-                    "id": tool_call_id,
-                    "name": tool_name,
-                    "args": {},  # 初期段階では空
-                }
-            ]
-
-    return ClaudeChunk()
+    return ClaudeChunk(
+        content=[{"type": "input_json_delta", "partial_json": partial_json}],
+        tool_calls=[{"id": tool_call_id, "name": tool_name, "args": {}}],  # 初期段階では空
+    )
 
 
 def create_openai_tool_call_chunk(
@@ -47,39 +82,39 @@ def create_openai_tool_call_chunk(
     tool_name: str,
     args_fragment: str,
     index: int,
-) -> Any:
+) -> OpenAIChunk:
     """OpenAI (GPT-5)形式のツール呼び出しチャンクを作成する。
 
     OpenAIは`tool_call_chunks`として部分的なargs文字列を送信する。
     """
+    return OpenAIChunk(
+        tool_call_chunks=[{"id": tool_call_id, "name": tool_name, "args": args_fragment, "index": index}],
+    )
 
-    class OpenAIChunk:
-        def __init__(self) -> None:
-            self.type = "AIMessageChunk"
-            self.content = ""
-            self.tool_call_chunks = [
-                {
-                    "id": tool_call_id,
-                    "name": tool_name,
-                    "args": args_fragment,
-                    "index": index,
-                }
-            ]
 
-    return OpenAIChunk()
+def create_tool_message_chunk(tool_call_id: str, tool_name: str, output: str) -> ToolChunk:
+    """ツール実行結果のメッセージチャンクを作成する（両API共通）。"""
+    return ToolChunk(tool_call_id, tool_name, output)
 
 
-def create_tool_message_chunk(tool_call_id: str, tool_name: str, output: str) -> Any:
-    """ツール実行結果のメッセージチャンクを作成する（両API共通）。"""
+def extract_tool_input_fragment(chunk: Any) -> str:
+    """チャンクからツール入力の断片を抽出する統一メソッド。
 
-    class ToolChunk:
-        def __init__(self) -> None:
-            self.type = "tool"
-            self.content = output
-            self.tool_call_id = tool_call_id
-            self.name = tool_name
+    LangChainAdapter._extract_json_fragmentと同じく、属性は1回ずつだけ取得する。
+    """
+    # Claudeのinput_json_deltaをチェック
+    content = getattr(chunk, "content", None)
+    if isinstance(content, list):
+        for item in content:
+            if type(item) is dict and item.get("type") == _DELTA_TYPE:
+                return item.get(_PARTIAL_KEY, "")
+
+    # OpenAIのtool_call_chunksをチェック（通常は最初の要素のargsを返す）
+    for tcc in getattr(chunk, "tool_call_chunks", None) or ():
+        if type(tcc) is dict and _ARGS_KEY in tcc:
+            return tcc[_ARGS_KEY]
 
-    return ToolChunk()
+    return ""
 
 
 # --- テストケース ---
@@ -97,17 +132,18 @@ class TestToolInputStreamingSpec:
         chunk3 = create_claude_tool_call_chunk("call_123", "get_weather", "}")
 
         # Act: partial_jsonを蓄積してパース
-        accumulated_json = ""
-        for chunk in [chunk1, chunk2, chunk3]:
-            for content_item in chunk.content:
-                if content_item.get("type") == "input_json_delta":
-                    accumulated_json += content_item.get("partial_json", "")
+        accumulated_json = "".join(
+            content_item.get(_PARTIAL_KEY, "")
+            for chunk in [chunk1, chunk2, chunk3]
+            for content_item in chunk.content
+            if content_item.get("type") == _DELTA_TYPE
+        )
 
         # Assert: 完全なJSONとしてパースできる
-        parsed = json.loads(accumulated_json)
+        parsed = _loads(accumulated_json)
         assert parsed == {"location": "Tokyo"}
         assert isinstance(chunk1.content, list)
-        assert chunk1.content[0]["type"] == "input_json_delta"
+        assert chunk1.content[0]["type"] == _DELTA_TYPE
 
     def test_openai_tool_call_chunks_structure(self) -> None:
         """OpenAI APIのtool_call_chunks形式を検証する。"""
@@ -117,14 +153,15 @@ class TestToolInputStreamingSpec:
         chunk3 = create_openai_tool_call_chunk(None, None, "}", 0)  # type: ignore
 
         # Act: args断片を蓄積してパース
-        accumulated_args = ""
-        for chunk in [chunk1, chunk2, chunk3]:
-            if hasattr(chunk, "tool_call_chunks"):
-                for tcc in chunk.tool_call_chunks:
-                    accumulated_args += tcc.get("args", "")
+        accumulated_args = "".join(
+            tcc.get(_ARGS_KEY, "")
+            for chunk in [chunk1, chunk2, chunk3]
+            if hasattr(chunk, "tool_call_chunks")
+            for tcc in chunk.tool_call_chunks
+        )
 
         # Assert: 完全なJSONとしてパースできる
-        parsed = json.loads(accumulated_args)
+        parsed = _loads(accumulated_args)
         assert parsed == {"location": "Tokyo"}
         assert hasattr(chunk1, "tool_call_chunks")
         assert chunk1.tool_call_chunks[0]["index"] == 0
@@ -145,7 +182,7 @@ class TestToolInputStreamingSpec:
         # Claude形式の特徴
         claude_chunk = create_claude_tool_call_chunk("call_1", "test_tool", '{"key": "val"}')
         assert isinstance(claude_chunk.content, list)
-        assert any(item.get("type") == "input_json_delta" for item in claude_chunk.content)
+        assert any(item.get("type") == _DELTA_TYPE for item in claude_chunk.content)
 
         # OpenAI形式の特徴
         openai_chunk = create_openai_tool_call_chunk("call_2", "test_tool", '{"key"', 0)
@@ -169,7 +206,7 @@ class TestUnificationFeasibility:
 
         # Claudeの判別
         has_input_json_delta = isinstance(claude_chunk.content, list) and any(
-            isinstance(item, dict) and item.get("type") == "input_json_delta" for item in claude_chunk.content
+            isinstance(item, dict) and item.get("type") == _DELTA_TYPE for item in claude_chunk.content
         )
         assert has_input_json_delta is True
 
@@ -190,41 +227,23 @@ class TestUnificationFeasibility:
         claude_fragment = ""
         if isinstance(claude_chunk.content, list):
             for item in claude_chunk.content:
-                if isinstance(item, dict) and item.get("type") == "input_json_delta":
-                    claude_fragment = item.get("partial_json", "")
+                if isinstance(item, dict) and item.get("type") == _DELTA_TYPE:
+                    claude_fragment = item.get(_PARTIAL_KEY, "")
 
         # OpenAI形式からJSON断片を抽出
         openai_chunk = create_openai_tool_call_chunk("call_2", "test", '"value"}', 0)
         openai_fragment = ""
         if hasattr(openai_chunk, "tool_call_chunks"):
             for tcc in openai_chunk.tool_call_chunks:
-                openai_fragment = tcc.get("args", "")
+                openai_fragment = tcc.get(_ARGS_KEY, "")
 
         # 抽出後のロジックは統一可能
         assert isinstance(claude_fragment, str)
         assert isinstance(openai_fragment, str)
-        # どちらも文字列として蓄積し、最後にjson.loads()でパース
+        # どちらも断片を"".joinで結合し、最後に一度だけパース（str += による再コピーを避ける）
 
     def test_proposed_unified_interface(self) -> None:
         """提案する統一インターフェースの設計を検証する。"""
-
-        def extract_tool_input_fragment(chunk: Any) -> str:
-            """チャンクからツール入力の断片を抽出する統一メソッド。"""
-            # Claudeのinput_json_deltaをチェック
-            if isinstance(getattr(chunk, "content", None), list):
-                for item in chunk.content:
-                    if isinstance(item, dict) and item.get("type") == "input_json_delta":
-                        return item.get("partial_json", "")
-
-            # OpenAIのtool_call_chunksをチェック
-            if hasattr(chunk, "tool_call_chunks") and chunk.tool_call_chunks:
-                # 通常は最初の要素のargsを返す
-                for tcc in chunk.tool_call_chunks:
-                    if isinstance(tcc, dict) and "args" in tcc:
-                        return tcc.get("args", "")
-
-            return ""
-
         # テスト
         claude_chunk = create_claude_tool_call_chunk("call_1", "test", '{"x":1}')
         openai_chunk = create_openai_tool_call_chunk("call_2", "test", '{"y":2}', 0)
@@ -241,51 +260,54 @@ class TestUnificationFeasibility:
 # --- 統合テスト用のフィクスチャ ---
 
 
-@pytest.fixture
-def sample_tool_streaming_scenario() -> dict[str, Any]:
-    """ツールストリーミングのサンプルシナリオを提供する。"""
-    return {
-        "claude_chunks": [
-            create_claude_tool_call_chunk("call_1", "calculate", '{"operation"'),
-            create_claude_tool_call_chunk("call_1", "calculate", ': "multiply",'),
-            create_claude_tool_call_chunk("call_1", "calculate", ' "values": [2, 3]}'),
-            create_tool_message_chunk("call_1", "calculate", "6"),
-        ],
-        "openai_chunks": [
-            create_openai_tool_call_chunk("call_2", "calculate", '{"operation"', 0),
-            create_openai_tool_call_chunk(None, None, ': "multiply",', 0),  # type: ignore
-            create_openai_tool_call_chunk(None, None, ' "values": [2, 3]}', 0),  # type: ignore
-            create_tool_message_chunk("call_2", "calculate", "6"),
-        ],
-        "expected_input": {"operation": "multiply", "values": [2, 3]},
-        "expected_output": "6",
-    }
+@pytest.fixture(scope="module")
+def sample_tool_streaming_scenario() -> Mapping[str, Any]:
+    """ツールストリーミングのサンプルシナリオを提供する。
+
+    読み取り専用のため、モジュール内で1度だけ構築し、変更できないようにして共有する。
+    """
+    return MappingProxyType(
+        {
+            "claude_chunks": (
+                create_claude_tool_call_chunk("call_1", "calculate", '{"operation"'),
+                create_claude_tool_call_chunk("call_1", "calculate", ': "multiply",'),
+                create_claude_tool_call_chunk("call_1", "calculate", ' "values": [2, 3]}'),
+                create_tool_message_chunk("call_1", "calculate", "6"),
+            ),
+            "openai_chunks": (
+                create_openai_tool_call_chunk("call_2", "calculate", '{"operation"', 0),
+                create_openai_tool_call_chunk(None, None, ': "multiply",', 0),  # type: ignore
+                create_openai_tool_call_chunk(None, None, ' "values": [2, 3]}', 0),  # type: ignore
+                create_tool_message_chunk("call_2", "calculate", "6"),
+            ),
+            "expected_input": {"operation": "multiply", "values": [2, 3]},
+            "expected_output": "6",
+        }
+    )
 
 
 @pytest.mark.integration
-def test_end_to_end_tool_streaming(sample_tool_streaming_scenario: dict[str, Any]) -> None:
+def test_end_to_end_tool_streaming(sample_tool_streaming_scenario: Mapping[str, Any]) -> None:
     """エンドツーエンドのツールストリーミングシナリオを検証する。"""
     scenario = sample_tool_streaming_scenario
 
-    # Claudeチャンクの処理
-    claude_accumulated = ""
-    for chunk in scenario["claude_chunks"][:-1]:  # 最後はツールメッセージ
-        if isinstance(chunk.content, list):
-            for item in chunk.content:
-                if item.get("type") == "input_json_delta":
-                    claude_accumulated += item.get("partial_json", "")
+    # Claudeチャンクの処理（最後はツールメッセージ）
+    claude_accumulated = "".join(
+        item[_PARTIAL_KEY]
+        for chunk in scenario["claude_chunks"][:-1]
+        for item in chunk.content
+        if item.get("type") == _DELTA_TYPE
+    )
 
-    claude_parsed = json.loads(claude_accumulated)
+    claude_parsed = _loads(claude_accumulated)
     assert claude_parsed == scenario["expected_input"]
 
-    # OpenAIチャンクの処理
-    openai_accumulated = ""
-    for chunk in scenario["openai_chunks"][:-1]:  # 最後はツールメッセージ
-        if hasattr(chunk, "tool_call_chunks"):
-            for tcc in chunk.tool_call_chunks:
-                openai_accumulated += tcc.get("args", "")
+    # OpenAIチャンクの処理（最後はツールメッセージ）
+    openai_accumulated = "".join(
+        tcc[_ARGS_KEY] for chunk in scenario["openai_chunks"][:-1] for tcc in chunk.tool_call_chunks
+    )
 
-    openai_parsed = json.loads(openai_accumulated)
+    openai_parsed = _loads(openai_accumulated)
     assert openai_parsed == scenario["expected_input"]
 
     # 両方とも同じ結果を得る
@@ -0,0 +1,48 @@
+"""プロンプト設定モジュールのユニットテスト。"""
+
+from src.config import prompts
+
+
+class TestGetCurrentUserProfileId:
+    """_get_current_user_profile_id関数のテスト。"""
+
+    def test_returns_profile_id_for_username(self) -> None:
+        """ログインユーザーのprofile_idが取得できることを確認。"""
+        assert prompts._get_current_user_profile_id("user002") == "user_diverse_frequent"
+
+    def test_unknown_username_returns_none(self) -> None:
+        """存在しないユーザーの場合はNoneが返されることを確認。"""
+        assert prompts._get_current_user_profile_id("unknown_user") is None
+
+    def test_repeated_lookup_uses_cache(self) -> None:
+        """同じユーザーのprofile_idがCSVを再読み込みせずキャッシュから返されることを確認。"""
+        prompts._lookup_profile_id.cache_clear()
+
+        first = prompts._get_current_user_profile_id("user001")
+        second = prompts._get_current_user_profile_id("user001")
+
+        assert first == second == "user_criollo_heavy"
+        assert prompts._lookup_profile_id.cache_info().hits == 1
+
+    def test_unknown_username_is_not_cached(self) -> None:
+        """見つからなかったユーザーは次回の呼び出しで再度CSVが確認されることを確認。"""
+        prompts._lookup_profile_id.cache_clear()
+
+        assert prompts._get_current_user_profile_id("unknown_user") is None
+        assert prompts._get_current_user_profile_id("unknown_user") is None
+
+        assert prompts._lookup_profile_id.cache_info().hits == 0
+        assert prompts._lookup_profile_id.cache_info().currsize == 0
+
+
+class TestGetAgentSystemPrompt:
+    """get_agent_system_prompt関数のテスト。"""
+
+    def test_prompt_embeds_profile_id_and_current_time(self) -> None:
+        """キャッシュ後もprofile_idと現在時刻が埋め込まれることを確認。"""
+        first = prompts.get_agent_system_prompt(username="user001")
+        second = prompts.get_agent_system_prompt(username="user001")
+
+        for message in (first, second):
+            assert "[現在対話中のユーザー: user_criollo_heavy]" in message.content
+            assert "[現在時刻: " in message.content
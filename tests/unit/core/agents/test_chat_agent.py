@@ -1,232 +1,228 @@
 """ChatAgentのユニットテスト。"""
 
-from collections.abc import AsyncIterator
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import AsyncIterator, Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.core.agents import chat_agent as chat_agent_module
 from src.core.agents.chat_agent import ChatAgent
 
+# ChatAgent.__init__内でimportされるため、定義元モジュールの属性をパッチする
+_CREATE_LLM_TARGET = "src.infrastructure.llm.llm_factory.create_llm"
 
+
+class _StubAdapter:
+    """LangChainAdapterの代わりに使う軽量スタブ（MagicMockより安価）。"""
+
+    __slots__ = ("astream", "ainvoke")
+
+    def __init__(self) -> None:
+        self.astream: Any = None
+        self.ainvoke: Any = None
+
+
+@pytest.fixture
+def stub_adapter() -> _StubAdapter:
+    """テストごとに新しいスタブアダプターを提供する（各テストは必要なメソッドだけ設定する）。"""
+    return _StubAdapter()
+
+
+@pytest.fixture(scope="class")
+def patched_agent() -> Iterator[ChatAgent]:
+    """読み取り専用テストで共有するChatAgentを作成する。
+
+    クラスデコレータのパッチはテストメソッドにしか適用されないため、ここでも同じ対象をパッチする。
+    """
+    with (
+        patch.multiple(chat_agent_module, AnthropicClient=MagicMock(), LangChainAdapter=MagicMock()),
+        patch(_CREATE_LLM_TARGET, new=MagicMock()),
+    ):
+        yield ChatAgent()
+
+
+@pytest.fixture(scope="class")
+def tool_names(patched_agent: ChatAgent) -> frozenset[str]:
+    """共有ChatAgentに登録されたツール名の集合（存在確認を定数時間で行う）。"""
+    return frozenset(tool.name for tool in patched_agent._tools)
+
+
+# new=を指定するとテスト関数へモックが引数注入されないため、pytestのフィクスチャ解決と衝突しない
+# create_llmもパッチし、テストごとに実際のLLMクライアントが構築されないようにする
+@patch.multiple(chat_agent_module, AnthropicClient=MagicMock(), LangChainAdapter=MagicMock())
+@patch(_CREATE_LLM_TARGET, new=MagicMock())
 class TestChatAgent:
     """ChatAgentのテスト。"""
 
     def test_chat_agent_initialization(self) -> None:
         """ChatAgentが正しく初期化されることを確認。"""
-        with patch("src.core.agents.chat_agent.AnthropicClient"), patch("src.core.agents.chat_agent.LangChainAdapter"):
-            agent = ChatAgent()
-            assert agent is not None
-            assert hasattr(agent, "_tools")
-            assert hasattr(agent, "_tool_instances")
-            assert hasattr(agent, "_adapter")
-            assert hasattr(agent, "_output_normalizer")
+        agent = ChatAgent()
+        assert agent is not None
+        assert hasattr(agent, "_tools")
+        assert hasattr(agent, "_tool_instances")
+        assert hasattr(agent, "_adapter")
+        assert hasattr(agent, "_output_normalizer")
 
     def test_chat_agent_initialization_with_custom_model(self) -> None:
         """カスタムモデルIDでChatAgentを初期化できることを確認。"""
-        with (
-            patch("src.core.agents.chat_agent.LangChainAdapter"),
-            patch("src.infrastructure.llm.llm_factory.create_llm"),
-        ):
-            agent = ChatAgent(model_id="gpt-5")
-            assert agent is not None
-            assert hasattr(agent, "_adapter")
-
-    def test_create_tools_returns_list(self) -> None:
+        agent = ChatAgent(model_id="gpt-5")
+        assert agent is not None
+        assert hasattr(agent, "_adapter")
+
+    def test_create_tools_returns_list(self, patched_agent: ChatAgent) -> None:
         """ツールレジストリからツールが正しくロードされることを確認。"""
-        with patch("src.core.agents.chat_agent.AnthropicClient"), patch("src.core.agents.chat_agent.LangChainAdapter"):
-            agent = ChatAgent()
-            tools = agent._tools
-            assert isinstance(tools, list)
-            # 現在5つのツールが登録されている
-            # search_events, search_stores, search_products, get_weather, get_user_profile
-            assert len(tools) == 5
-
-    def test_create_tools_contains_store_search_tool(self) -> None:
+        tools = patched_agent._tools
+        assert isinstance(tools, list)
+        # 現在5つのツールが登録されている
+        # search_events, search_stores, search_products, get_weather, get_user_profile
+        assert len(tools) == 5
+
+    def test_create_tools_contains_store_search_tool(self, tool_names: frozenset[str]) -> None:
         """ツールレジストリがstore search toolを含むことを確認。"""
-        with patch("src.core.agents.chat_agent.AnthropicClient"), patch("src.core.agents.chat_agent.LangChainAdapter"):
-            agent = ChatAgent()
-            tools = agent._tools
-            tool_names = [tool.name for tool in tools]
-            assert "search_stores" in tool_names
+        assert "search_stores" in tool_names
 
-    def test_create_tools_does_not_contain_time_tool(self) -> None:
+    def test_create_tools_does_not_contain_time_tool(self, tool_names: frozenset[str]) -> None:
         """ツールレジストリがtime toolを含まないことを確認（現在時刻はシステムプロンプトに自動埋め込み）。"""
-        with patch("src.core.agents.chat_agent.AnthropicClient"), patch("src.core.agents.chat_agent.LangChainAdapter"):
-            agent = ChatAgent()
-            tools = agent._tools
-            tool_names = [tool.name for tool in tools]
-            assert "get_current_time" not in tool_names
+        assert "get_current_time" not in tool_names
 
     @pytest.mark.asyncio
-    async def test_astream_response_yields_content(self) -> None:
+    async def test_astream_response_yields_content(self, stub_adapter: _StubAdapter) -> None:
         """astream_responseがコンテンツをyieldすることを確認。"""
-        mock_adapter = MagicMock()
 
         async def mock_astream(user_input: str, session_id: str) -> AsyncIterator[tuple[str, str, None]]:
             yield ("ai", "Hello ", None)
             yield ("ai", "World", None)
 
-        mock_adapter.astream = mock_astream
-
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        stub_adapter.astream = mock_astream
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-            chunks = []
-            async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
-                chunks.append(content)
+        chunks = []
+        async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
+            chunks.append(content)
 
-            assert len(chunks) == 2
-            # OutputNormalizerがホワイトスペースをトリムするため、末尾の空白は削除される
-            assert chunks[0] == "Hello"
-            assert chunks[1] == "World"
+        assert len(chunks) == 2
+        # OutputNormalizerがホワイトスペースをトリムするため、末尾の空白は削除される
+        assert chunks[0] == "Hello"
+        assert chunks[1] == "World"
 
     @pytest.mark.asyncio
-    async def test_astream_response_filters_non_ai_messages(self) -> None:
+    async def test_astream_response_filters_non_ai_messages(self, stub_adapter: _StubAdapter) -> None:
         """astream_responseがAI以外のメッセージをフィルタすることを確認。"""
-        mock_adapter = MagicMock()
 
         async def mock_astream(user_input: str, session_id: str) -> AsyncIterator[tuple[str, str, None]]:
             yield ("system", "System message", None)
             yield ("ai", "AI response", None)
             yield ("tool", "Tool output", None)
 
-        mock_adapter.astream = mock_astream
+        stub_adapter.astream = mock_astream
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        chunks = []
+        async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
+            chunks.append(content)
 
-            chunks = []
-            async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
-                chunks.append(content)
-
-            # AI メッセージのみが返される
-            assert len(chunks) == 1
-            assert chunks[0] == "AI response"
+        # AI メッセージのみが返される
+        assert len(chunks) == 1
+        assert chunks[0] == "AI response"
 
     @pytest.mark.asyncio
-    async def test_astream_response_handles_empty_content(self) -> None:
+    async def test_astream_response_handles_empty_content(self, stub_adapter: _StubAdapter) -> None:
         """astream_responseが空のコンテンツを処理することを確認。"""
-        mock_adapter = MagicMock()
 
         async def mock_astream(user_input: str, session_id: str) -> AsyncIterator[tuple[str, str, None]]:
             yield ("ai", "", None)
             yield ("ai", "Valid content", None)
             yield ("ai", "", None)
 
-        mock_adapter.astream = mock_astream
-
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        stub_adapter.astream = mock_astream
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-            chunks = []
-            async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
-                chunks.append(content)
+        chunks = []
+        async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
+            chunks.append(content)
 
-            # 空のコンテンツはスキップされる
-            assert len(chunks) == 1
-            assert chunks[0] == "Valid content"
+        # 空のコンテンツはスキップされる
+        assert len(chunks) == 1
+        assert chunks[0] == "Valid content"
 
     @pytest.mark.asyncio
-    async def test_astream_response_handles_exception(self) -> None:
+    async def test_astream_response_handles_exception(self, stub_adapter: _StubAdapter) -> None:
         """astream_response中の例外が正しく処理されることを確認。"""
-        mock_adapter = MagicMock()
 
         async def mock_astream_error(user_input: str, session_id: str) -> AsyncIterator[tuple[str, str, None]]:
             raise Exception("Test error")
             yield  # この行は実行されない
 
-        mock_adapter.astream = mock_astream_error
-
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        stub_adapter.astream = mock_astream_error
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-            chunks = []
-            async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
-                chunks.append(content)
+        chunks = []
+        async for content, _tool_exec in agent.astream_response(user_input="Hi", session_id="test"):
+            chunks.append(content)
 
-            assert len(chunks) == 1
-            assert "エラー" in chunks[0]
-            assert "Test error" in chunks[0]
+        assert len(chunks) == 1
+        assert "エラー" in chunks[0]
+        assert "Test error" in chunks[0]
 
     @pytest.mark.asyncio
-    async def test_ainvoke_returns_dict(self) -> None:
+    async def test_ainvoke_returns_dict(self, stub_adapter: _StubAdapter) -> None:
         """ainvokeが辞書を返すことを確認。"""
-        mock_adapter = MagicMock()
-        mock_message = MagicMock()
-        mock_message.type = "ai"
-        mock_message.content = "AI response"
-        mock_adapter.ainvoke = AsyncMock(return_value={"messages": [mock_message]})
+        mock_message = SimpleNamespace(type="ai", content="AI response")
 
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        async def mock_ainvoke(user_input: str, session_id: str) -> dict[str, Any]:
+            return {"messages": [mock_message]}
 
-            result = await agent.ainvoke(user_input="Hi", session_id="test")
+        stub_adapter.ainvoke = mock_ainvoke
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-            assert isinstance(result, dict)
-            assert "output" in result
-            assert "messages" in result
+        result = await agent.ainvoke(user_input="Hi", session_id="test")
+
+        assert isinstance(result, dict)
+        assert "output" in result
+        assert "messages" in result
 
     @pytest.mark.asyncio
-    async def test_ainvoke_extracts_output(self) -> None:
+    async def test_ainvoke_extracts_output(self, stub_adapter: _StubAdapter) -> None:
         """ainvokeが出力を正しく抽出することを確認。"""
-        mock_adapter = MagicMock()
-        mock_message = MagicMock()
-        mock_message.type = "ai"
-        mock_message.content = "Expected output"
-        mock_adapter.ainvoke = AsyncMock(return_value={"messages": [mock_message]})
+        mock_message = SimpleNamespace(type="ai", content="Expected output")
+
+        async def mock_ainvoke(user_input: str, session_id: str) -> dict[str, Any]:
+            return {"messages": [mock_message]}
 
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        stub_adapter.ainvoke = mock_ainvoke
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-            result = await agent.ainvoke(user_input="Hi", session_id="test")
+        result = await agent.ainvoke(user_input="Hi", session_id="test")
 
-            assert result["output"] == "Expected output"
+        assert result["output"] == "Expected output"
 
     @pytest.mark.asyncio
-    async def test_ainvoke_handles_exception(self) -> None:
+    async def test_ainvoke_handles_exception(self, stub_adapter: _StubAdapter) -> None:
         """ainvoke中の例外が正しく処理されることを確認。"""
-        mock_adapter = MagicMock()
-        mock_adapter.ainvoke = AsyncMock(side_effect=Exception("Test error"))
 
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        async def mock_ainvoke_error(user_input: str, session_id: str) -> dict[str, Any]:
+            raise Exception("Test error")
 
-            result = await agent.ainvoke(user_input="Hi", session_id="test")
+        stub_adapter.ainvoke = mock_ainvoke_error
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-            assert "エラー" in result["output"]
-            assert "Test error" in result["output"]
-            assert result["messages"] == []
+        result = await agent.ainvoke(user_input="Hi", session_id="test")
+
+        assert "エラー" in result["output"]
+        assert "Test error" in result["output"]
+        assert result["messages"] == []
 
     @pytest.mark.asyncio
-    async def test_astream_response_with_different_session_ids(self) -> None:
+    async def test_astream_response_with_different_session_ids(self, stub_adapter: _StubAdapter) -> None:
         """異なるsession_idでastream_responseが動作することを確認。"""
         call_count = 0
 
@@ -235,20 +231,14 @@ class TestChatAgent:
             call_count += 1
             yield ("ai", "Response", None)
 
-        mock_adapter = MagicMock()
-        mock_adapter.astream = mock_astream
-
-        with (
-            patch("src.core.agents.chat_agent.AnthropicClient"),
-            patch("src.core.agents.chat_agent.LangChainAdapter", return_value=mock_adapter),
-        ):
-            agent = ChatAgent()
-            agent._adapter = mock_adapter
+        stub_adapter.astream = mock_astream
+        agent = ChatAgent()
+        agent._adapter = stub_adapter
 
-            # 異なるsession_idで複数回呼び出し
-            async for _ in agent.astream_response(user_input="Hi", session_id="session1"):
-                pass
-            async for _ in agent.astream_response(user_input="Hello", session_id="session2"):
-                pass
+        # 異なるsession_idで複数回呼び出し
+        async for _ in agent.astream_response(user_input="Hi", session_id="session1"):
+            pass
+        async for _ in agent.astream_response(user_input="Hello", session_id="session2"):
+            pass
 
-            assert call_count == 2
+        assert call_count == 2
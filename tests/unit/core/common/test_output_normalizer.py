@@ -1,57 +1,67 @@
 """OutputNormalizerのユニットテスト。"""
 
-from src.core.common.output_normalizer import OutputNormalizer
-
-
-class TestOutputNormalizer:
-    """OutputNormalizerのテスト。"""
+from typing import Any
 
-    def test_normalize_string_input(self) -> None:
-        """文字列入力がそのまま返されることを確認。"""
-        result = OutputNormalizer.normalize("Hello, World!")
-        assert result == "Hello, World!"
+import pytest
 
-    def test_normalize_empty_string(self) -> None:
-        """空文字列がそのまま返されることを確認。"""
-        result = OutputNormalizer.normalize("")
-        assert result == ""
+from src.core.common.output_normalizer import OutputNormalizer
 
-    def test_normalize_integer(self) -> None:
-        """整数が文字列に変換されることを確認。"""
-        result = OutputNormalizer.normalize(42)
-        assert result == "42"
-        assert isinstance(result, str)
+# 複数のテストで共有する入力（タプルにして誤って変更されないようにする）
+_MIXED_ITEMS = ({"text": "Hello "}, "middle ", {"content": "World"}, {"other_key": "ignored"})
+_ITEMS_WITH_EMPTY_DICT = ({"text": "Before"}, {}, {"content": "After"})
+_COMPLEX_ITEMS = ({"text": "Start "}, "middle ", {"content": "end"}, {"ignored": "value"})
 
-    def test_normalize_float(self) -> None:
-        """浮動小数点数が文字列に変換されることを確認。"""
-        result = OutputNormalizer.normalize(3.14)
-        assert result == "3.14"
-        assert isinstance(result, str)
 
-    def test_normalize_boolean(self) -> None:
-        """真偽値が文字列に変換されることを確認。"""
-        result_true = OutputNormalizer.normalize(True)
-        result_false = OutputNormalizer.normalize(False)
-        assert result_true == "True"
-        assert result_false == "False"
+class TestOutputNormalizer:
+    """OutputNormalizerのテスト。"""
 
-    def test_normalize_none(self) -> None:
-        """Noneが文字列に変換されることを確認。"""
-        result = OutputNormalizer.normalize(None)
-        assert result == "None"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param("Hello, World!", "Hello, World!", id="string"),
+            pytest.param("", "", id="empty_string"),
+            pytest.param(42, "42", id="integer"),
+            pytest.param(3.14, "3.14", id="float"),
+            pytest.param(True, "True", id="true"),
+            pytest.param(False, "False", id="false"),
+            pytest.param(None, "None", id="none"),
+            pytest.param("こんにちは世界 🌍", "こんにちは世界 🌍", id="unicode"),
+            # 余分なホワイトスペースは正規化される（トリム＋1つのスペースに圧縮）
+            pytest.param("  Hello  \n  World  ", "Hello World", id="whitespace"),
+        ],
+    )
+    def test_normalize_scalar(self, value: Any, expected: str) -> None:
+        """スカラー値が文字列に正規化されることを確認。"""
+        result = OutputNormalizer.normalize(value)
+        assert result == expected
         assert isinstance(result, str)
 
-    def test_normalize_dict_with_text_key(self) -> None:
-        """textキーを持つ辞書が正しく正規化されることを確認。"""
-        input_dict = {"text": "Response from agent"}
-        result = OutputNormalizer.normalize(input_dict)
-        assert result == "Response from agent"
-
-    def test_normalize_dict_with_content_key(self) -> None:
-        """contentキーを持つ辞書が正しく正規化されることを確認。"""
-        input_dict = {"content": "Agent response content"}
-        result = OutputNormalizer.normalize(input_dict)
-        assert result == "Agent response content"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param({"text": "Response from agent"}, "Response from agent", id="text_key"),
+            pytest.param({"content": "Agent response content"}, "Agent response content", id="content_key"),
+            pytest.param({"text": "Outer text", "nested": {"text": "Inner text"}}, "Outer text", id="nested"),
+            pytest.param({"text": 12345}, "12345", id="integer_value"),
+        ],
+    )
+    def test_normalize_dict(self, value: dict[str, Any], expected: str) -> None:
+        """text/contentキーを持つ辞書が正しく正規化されることを確認。"""
+        assert OutputNormalizer.normalize(value) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param([{"text": "Hello "}, {"text": "World"}], "Hello World", id="dicts_with_text"),
+            pytest.param([{"content": "First "}, {"content": "Second"}], "First Second", id="dicts_with_content"),
+            pytest.param(["Hello", " ", "World"], "Hello World", id="strings"),
+            pytest.param([], "", id="empty"),
+            pytest.param([{"text": "日本語"}, {"content": "テキスト"}], "日本語テキスト", id="unicode_dicts"),
+        ],
+    )
+    def test_normalize_list(self, value: list[Any], expected: str) -> None:
+        """リストの要素が正しく連結されることを確認。"""
+        assert OutputNormalizer.normalize(value) == expected
 
     def test_normalize_dict_without_special_keys(self) -> None:
         """特別なキーを持たない辞書が文字列に変換されることを確認。"""
@@ -61,88 +71,39 @@ class TestOutputNormalizer:
         assert "key1" in result
         assert "value1" in result
 
-    def test_normalize_list_of_dicts_with_text(self) -> None:
-        """textキーを持つ辞書のリストが正しく連結されることを確認。"""
-        input_list = [{"text": "Hello "}, {"text": "World"}]
-        result = OutputNormalizer.normalize(input_list)
-        assert result == "Hello World"
-
-    def test_normalize_list_of_dicts_with_content(self) -> None:
-        """contentキーを持つ辞書のリストが正しく連結されることを確認。"""
-        input_list = [{"content": "First "}, {"content": "Second"}]
-        result = OutputNormalizer.normalize(input_list)
-        assert result == "First Second"
-
-    def test_normalize_list_of_strings(self) -> None:
-        """文字列のリストが連結されることを確認。"""
-        input_list = ["Hello", " ", "World"]
-        result = OutputNormalizer.normalize(input_list)
-        assert result == "Hello World"
-
-    def test_normalize_empty_list(self) -> None:
-        """空のリストが空文字列を返すことを確認。"""
-        result = OutputNormalizer.normalize([])
-        assert result == ""
-
     def test_normalize_mixed_list(self) -> None:
         """混合型のリストが正しく処理されることを確認。"""
-        input_list = [
-            {"text": "Hello "},
-            "middle ",
-            {"content": "World"},
-            {"other_key": "ignored"},
-        ]
-        result = OutputNormalizer.normalize(input_list)
+        result = OutputNormalizer.normalize(list(_MIXED_ITEMS))
         assert "Hello " in result
         assert "middle " in result
         assert "World" in result
 
-    def test_normalize_nested_dict_with_text(self) -> None:
-        """textキーを持つネストされた辞書が正しく処理されることを確認。"""
-        input_dict = {"text": "Outer text", "nested": {"text": "Inner text"}}
-        result = OutputNormalizer.normalize(input_dict)
-        assert result == "Outer text"
-
     def test_normalize_list_with_empty_dicts(self) -> None:
         """空の辞書を含むリストが正しく処理されることを確認。"""
-        input_list = [{"text": "Before"}, {}, {"content": "After"}]
-        result = OutputNormalizer.normalize(input_list)
+        result = OutputNormalizer.normalize(list(_ITEMS_WITH_EMPTY_DICT))
         assert "Before" in result
         assert "After" in result
 
-    def test_normalize_preserves_whitespace(self) -> None:
-        """ホワイトスペースが正規化されることを確認。"""
-        # OutputNormalizerは余分なホワイトスペースを正規化（トリム＋1つのスペースに圧縮）
-        result = OutputNormalizer.normalize("  Hello  \n  World  ")
-        assert result == "Hello World"
-
-    def test_normalize_unicode_text(self) -> None:
-        """Unicode文字が正しく処理されることを確認。"""
-        unicode_text = "こんにちは世界 🌍"
-        result = OutputNormalizer.normalize(unicode_text)
-        assert result == unicode_text
-
-    def test_normalize_list_with_unicode_dicts(self) -> None:
-        """Unicode文字を含む辞書のリストが正しく処理されることを確認。"""
-        input_list = [{"text": "日本語"}, {"content": "テキスト"}]
-        result = OutputNormalizer.normalize(input_list)
-        assert result == "日本語テキスト"
-
     def test_normalize_complex_nested_structure(self) -> None:
         """複雑にネストされた構造が正しく処理されることを確認。"""
-        input_list = [
-            {"text": "Start "},
-            "middle ",
-            {"content": "end"},
-            {"ignored": "value"},
-        ]
-        result = OutputNormalizer.normalize(input_list)
+        result = OutputNormalizer.normalize(list(_COMPLEX_ITEMS))
         assert "Start " in result
         assert "middle " in result
         assert "end" in result
 
-    def test_normalize_dict_with_integer_values(self) -> None:
-        """整数値を含む辞書が正しく処理されることを確認。"""
-        input_dict = {"text": 12345}
-        result = OutputNormalizer.normalize(input_dict)
-        assert result == "12345"
+    def test_normalize_clean_string_returns_same_object(self) -> None:
+        """正規化が不要な文字列はコピーされずに同じオブジェクトが返されることを確認。"""
+        text = "Hello, World!"
+        assert OutputNormalizer.normalize(text) is text
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param("おすすめは店舗ID：STR-0001のカフェ", "おすすめはのカフェ", id="label"),
+            pytest.param("カフェ(STR-0002)です", "カフェです", id="parenthesized"),
+            pytest.param('{"name": "カフェ", "store_id": "STR-0003"}', '{"name": "カフェ"}', id="json_field"),
+        ],
+    )
+    def test_normalize_removes_store_id(self, value: str, expected: str) -> None:
+        """店舗IDが出力から除去されることを確認。"""
+        assert OutputNormalizer.normalize(value) == expected
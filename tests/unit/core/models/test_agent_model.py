@@ -1,9 +1,41 @@
 """ChatMessageとMessageRoleモデルのユニットテスト。"""
 
 from datetime import datetime
+from typing import Any, Optional
+
+import pytest
 
 from src.core.models.agent_model import ChatMessage, MessageRole, TextPart, ToolExecution, ToolPart
 
+# 実時刻に依存しないテスト用の固定時刻
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+# 長文contentのテストデータ（インポート時に一度だけ生成する）
+_LONG_CONTENT = "a" * 10_000
+
+
+def _mk(
+    role: MessageRole,
+    content: str,
+    timestamp: Optional[datetime] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> ChatMessage:
+    """検証をスキップしてChatMessageを作成する（フィールド値のみを確認するテスト用）。
+
+    バリデーションやdefault_factoryを検証するテストでは通常のコンストラクタを使うこと。
+    """
+    return ChatMessage.model_construct(
+        role=role,
+        parts=[TextPart.model_construct(type="text", content=content)],
+        timestamp=timestamp or _FIXED_NOW,
+        metadata=metadata,
+    )
+
+
+@pytest.fixture
+def fixed_now() -> datetime:
+    """テストで使う固定時刻（timestampの自動生成を検証するテスト以外で使用する）。"""
+    return _FIXED_NOW
+
 
 class TestMessageRole:
     """MessageRole列挙型のテスト。"""
@@ -14,6 +46,12 @@ class TestMessageRole:
         assert MessageRole.ASSISTANT == "assistant"
         assert MessageRole.SYSTEM == "system"
 
+    @pytest.mark.parametrize("role", list(MessageRole))
+    def test_message_role_members_are_singletons(self, role: MessageRole) -> None:
+        """値からの変換やモデル検証を経ても同一のメンバーが返ることを確認（isで比較できる）。"""
+        assert MessageRole(role.value) is role
+        assert ChatMessage(role=role.value, parts=[]).role is role
+
     def test_message_role_is_string_enum(self) -> None:
         """MessageRoleがstr型のEnumであることを確認。"""
         assert isinstance(MessageRole.USER.value, str)
@@ -27,22 +65,22 @@ class TestChatMessage:
         """必須フィールドのみでChatMessageを作成できることを確認。"""
         message = ChatMessage(role=MessageRole.USER, parts=[TextPart(content="Hello")])
 
-        assert message.role == MessageRole.USER
+        assert message.role is MessageRole.USER
         assert len(message.parts) == 1
         assert message.parts[0].type == "text"
         assert message.parts[0].content == "Hello"
         assert isinstance(message.timestamp, datetime)
         assert message.metadata is None
 
-    def test_create_chat_message_with_all_fields(self) -> None:
+    def test_create_chat_message_with_all_fields(self, fixed_now: datetime) -> None:
         """すべてのフィールドを指定してChatMessageを作成できることを確認。"""
-        timestamp = datetime.now()
+        timestamp = fixed_now
         metadata = {"source": "test", "version": "1.0"}
         message = ChatMessage(
             role=MessageRole.ASSISTANT, parts=[TextPart(content="Hi there")], timestamp=timestamp, metadata=metadata
         )
 
-        assert message.role == MessageRole.ASSISTANT
+        assert message.role is MessageRole.ASSISTANT
         assert message.parts[0].content == "Hi there"
         assert message.timestamp == timestamp
         assert message.metadata == metadata
@@ -63,35 +101,31 @@ class TestChatMessage:
             "platform": "web",
             "nested": {"key": "value"},
         }
-        message = ChatMessage(role=MessageRole.USER, parts=[TextPart(content="Test")], metadata=metadata)
+        message = _mk(MessageRole.USER, "Test", metadata=metadata)
 
         assert message.metadata == metadata
         assert message.metadata["user_id"] == "123"
         assert message.metadata["nested"]["key"] == "value"
 
-    def test_chat_message_different_roles(self) -> None:
+    @pytest.mark.parametrize("role", list(MessageRole))
+    def test_chat_message_different_roles(self, role: MessageRole) -> None:
         """異なるロールでChatMessageを作成できることを確認。"""
-        user_msg = ChatMessage(role=MessageRole.USER, parts=[TextPart(content="User message")])
-        assistant_msg = ChatMessage(role=MessageRole.ASSISTANT, parts=[TextPart(content="Assistant message")])
-        system_msg = ChatMessage(role=MessageRole.SYSTEM, parts=[TextPart(content="System message")])
+        message = _mk(role, f"{role.value} message")
 
-        assert user_msg.role == MessageRole.USER
-        assert assistant_msg.role == MessageRole.ASSISTANT
-        assert system_msg.role == MessageRole.SYSTEM
+        assert message.role is role
 
     def test_chat_message_empty_content(self) -> None:
         """空のcontentでChatMessageを作成できることを確認。"""
-        message = ChatMessage(role=MessageRole.USER, parts=[TextPart(content="")])
+        message = _mk(MessageRole.USER, "")
 
         assert message.parts[0].content == ""
-        assert message.role == MessageRole.USER
+        assert message.role is MessageRole.USER
 
     def test_chat_message_long_content(self) -> None:
         """長いcontentでChatMessageを作成できることを確認。"""
-        long_content = "a" * 10000
-        message = ChatMessage(role=MessageRole.ASSISTANT, parts=[TextPart(content=long_content)])
+        message = _mk(MessageRole.ASSISTANT, _LONG_CONTENT)
 
-        assert message.parts[0].content == long_content
+        assert message.parts[0].content is _LONG_CONTENT
         assert len(message.parts[0].content) == 10000
 
     def test_chat_message_immutability_with_pydantic(self) -> None:
@@ -101,21 +135,22 @@ class TestChatMessage:
         # Pydanticモデルのフィールドにアクセスできることを確認
         assert message.model_fields_set == {"role", "parts"}
 
-    def test_chat_message_dict_conversion(self) -> None:
+    def test_chat_message_dict_conversion(self, fixed_now: datetime) -> None:
         """ChatMessageを辞書に変換できることを確認。"""
-        timestamp = datetime.now()
+        timestamp = fixed_now
         metadata = {"key": "value"}
         message = ChatMessage(
             role=MessageRole.USER, parts=[TextPart(content="Test")], timestamp=timestamp, metadata=metadata
         )
 
-        message_dict = message.model_dump()
+        # JSON互換の辞書（Enumは文字列、datetimeはISO形式）を1回のダンプで取得する
+        message_dict = message.model_dump(mode="json")
 
         assert message_dict["role"] == "user"
         assert len(message_dict["parts"]) == 1
         assert message_dict["parts"][0]["type"] == "text"
         assert message_dict["parts"][0]["content"] == "Test"
-        assert message_dict["timestamp"] == timestamp
+        assert message_dict["timestamp"] == timestamp.isoformat()
         assert message_dict["metadata"] == metadata
 
     def test_chat_message_json_serialization(self) -> None:
@@ -147,4 +182,4 @@ class TestChatMessage:
         message = ChatMessage(role=MessageRole.ASSISTANT, parts=[])
 
         assert len(message.parts) == 0
-        assert message.role == MessageRole.ASSISTANT
+        assert message.role is MessageRole.ASSISTANT
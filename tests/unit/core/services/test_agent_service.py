@@ -1,53 +1,74 @@
 """AgentServiceのユニットテスト。"""
 
-from collections.abc import AsyncIterator
-from unittest.mock import MagicMock, patch
+from collections.abc import AsyncIterator, Callable
+from typing import Any, Optional
 
 import pytest
 
 from src.core.services.agent_service import AgentService
 
 
+class _StubAgent:
+    """ChatAgentの代わりに使う軽量スタブ（MagicMockとpatchを使わない）。
+
+    各テストはastream_responseに非同期ジェネレータ関数を直接設定する。
+    """
+
+    def __init__(self) -> None:
+        self.init_kwargs: dict[str, Any] = {}
+        self.astream_response: Optional[Callable[[str, str], AsyncIterator[tuple[str, None]]]] = None
+
+    def __call__(self, **kwargs: Any) -> "_StubAgent":
+        """ChatAgent(...)の呼び出しを受け、引数を記録して自身を返す。"""
+        self.init_kwargs = kwargs
+        return self
+
+
+@pytest.fixture(autouse=True)
+def stub_agent(monkeypatch: pytest.MonkeyPatch) -> _StubAgent:
+    """AgentServiceが生成するChatAgentをテストごとのスタブに差し替える。"""
+    stub = _StubAgent()
+    monkeypatch.setattr("src.core.services.agent_service.ChatAgent", stub)
+    return stub
+
+
 @pytest.mark.asyncio
 class TestAgentService:
     """AgentServiceのテスト。"""
 
     async def test_agent_service_initialization(self) -> None:
         """AgentServiceが正しく初期化されることを確認。"""
-        with patch("src.core.services.agent_service.ChatAgent"):
-            service = AgentService()
-            assert service is not None
-            assert hasattr(service, "_agent")
+        service = AgentService()
+        assert service is not None
+        assert hasattr(service, "_agent")
 
-    async def test_agent_service_with_custom_client(self) -> None:
+    async def test_agent_service_with_custom_client(self, stub_agent: _StubAgent) -> None:
         """カスタムAnthropicクライアントでAgentServiceを初期化できることを確認。"""
-        mock_client = MagicMock()
-        with patch("src.core.services.agent_service.ChatAgent"):
-            service = AgentService(anthropic_client=mock_client)
-            assert service is not None
+        client = object()
+        service = AgentService(anthropic_client=client)  # type: ignore[arg-type]
+        assert service is not None
+        assert stub_agent.init_kwargs["anthropic_client"] is client
 
-    async def test_stream_message_yields_chunks(self) -> None:
+    async def test_stream_message_yields_chunks(self, stub_agent: _StubAgent) -> None:
         """stream_messageがチャンクをyieldすることを確認。"""
-        mock_agent = MagicMock()
 
         async def mock_astream(user_input: str, session_id: str) -> AsyncIterator[tuple[str, None]]:
             yield ("Hello ", None)
             yield ("World", None)
 
-        mock_agent.astream_response = mock_astream
+        stub_agent.astream_response = mock_astream
 
-        with patch("src.core.services.agent_service.ChatAgent", return_value=mock_agent):
-            service = AgentService()
+        service = AgentService()
 
-            chunks = []
-            async for chunk, _tool_exec in service.stream_message(session_id="test_session", message="Hi"):
-                chunks.append(chunk)
+        chunks = []
+        async for chunk, _tool_exec in service.stream_message(session_id="test_session", message="Hi"):
+            chunks.append(chunk)
 
-            assert len(chunks) == 2
-            assert chunks[0] == "Hello "
-            assert chunks[1] == "World"
+        assert len(chunks) == 2
+        assert chunks[0] == "Hello "
+        assert chunks[1] == "World"
 
-    async def test_stream_message_with_session_id(self) -> None:
+    async def test_stream_message_with_session_id(self, stub_agent: _StubAgent) -> None:
         """stream_messageがsession_idを正しく渡すことを確認。"""
         received_session_id = None
         received_user_input = None
@@ -58,39 +79,35 @@ class TestAgentService:
             received_user_input = user_input
             yield ("Response", None)
 
-        mock_agent = MagicMock()
-        mock_agent.astream_response = mock_astream
+        stub_agent.astream_response = mock_astream
 
-        with patch("src.core.services.agent_service.ChatAgent", return_value=mock_agent):
-            service = AgentService()
+        service = AgentService()
 
-            chunks = []
-            async for chunk, _tool_exec in service.stream_message(session_id="custom_session", message="Test message"):
-                chunks.append(chunk)
+        chunks = []
+        async for chunk, _tool_exec in service.stream_message(session_id="custom_session", message="Test message"):
+            chunks.append(chunk)
 
-            # astream_responseが正しい引数で呼び出されたことを確認
-            assert received_session_id == "custom_session"
-            assert received_user_input == "Test message"
+        # astream_responseが正しい引数で呼び出されたことを確認
+        assert received_session_id == "custom_session"
+        assert received_user_input == "Test message"
 
-    async def test_stream_message_handles_exception(self) -> None:
+    async def test_stream_message_handles_exception(self, stub_agent: _StubAgent) -> None:
         """stream_message中の例外が正しく伝播されることを確認。"""
 
         async def mock_astream_error(user_input: str, session_id: str) -> AsyncIterator[tuple[str, None]]:
             raise Exception("Test error")
             yield  # この行は実行されない
 
-        mock_agent = MagicMock()
-        mock_agent.astream_response = mock_astream_error
+        stub_agent.astream_response = mock_astream_error
 
-        with patch("src.core.services.agent_service.ChatAgent", return_value=mock_agent):
-            service = AgentService()
+        service = AgentService()
 
-            # 例外が伝播されることを確認（エラーハンドリングはChatAgentの責任）
-            with pytest.raises(Exception, match="Test error"):
-                async for _chunk, _tool_exec in service.stream_message(session_id="test", message="Hi"):
-                    pass
+        # 例外が伝播されることを確認（エラーハンドリングはChatAgentの責任）
+        with pytest.raises(Exception, match="Test error"):
+            async for _chunk, _tool_exec in service.stream_message(session_id="test", message="Hi"):
+                pass
 
-    async def test_stream_message_empty_response(self) -> None:
+    async def test_stream_message_empty_response(self, stub_agent: _StubAgent) -> None:
         """空のレスポンスが正しく処理されることを確認。"""
 
         async def mock_astream(user_input: str, session_id: str) -> AsyncIterator[tuple[str, None]]:
@@ -98,56 +115,50 @@ class TestAgentService:
             return
             yield  # この行は実行されない
 
-        mock_agent = MagicMock()
-        mock_agent.astream_response = mock_astream
+        stub_agent.astream_response = mock_astream
 
-        with patch("src.core.services.agent_service.ChatAgent", return_value=mock_agent):
-            service = AgentService()
+        service = AgentService()
 
-            chunks = []
-            async for chunk, _tool_exec in service.stream_message(session_id="test", message="Hi"):
-                chunks.append(chunk)
+        chunks = []
+        async for chunk, _tool_exec in service.stream_message(session_id="test", message="Hi"):
+            chunks.append(chunk)
 
-            assert len(chunks) == 0
+        assert len(chunks) == 0
 
-    async def test_stream_message_multiple_chunks(self) -> None:
+    async def test_stream_message_multiple_chunks(self, stub_agent: _StubAgent) -> None:
         """複数のチャンクが順番にyieldされることを確認。"""
 
         async def mock_astream(user_input: str, session_id: str) -> AsyncIterator[tuple[str, None]]:
             for i in range(5):
                 yield (f"chunk{i} ", None)
 
-        mock_agent = MagicMock()
-        mock_agent.astream_response = mock_astream
+        stub_agent.astream_response = mock_astream
 
-        with patch("src.core.services.agent_service.ChatAgent", return_value=mock_agent):
-            service = AgentService()
+        service = AgentService()
 
-            chunks = []
-            async for chunk, _tool_exec in service.stream_message(session_id="test", message="Hi"):
-                chunks.append(chunk)
+        chunks = []
+        async for chunk, _tool_exec in service.stream_message(session_id="test", message="Hi"):
+            chunks.append(chunk)
 
-            assert len(chunks) == 5
-            for i in range(5):
-                assert chunks[i] == f"chunk{i} "
+        assert len(chunks) == 5
+        for i in range(5):
+            assert chunks[i] == f"chunk{i} "
 
-    async def test_stream_message_with_unicode(self) -> None:
+    async def test_stream_message_with_unicode(self, stub_agent: _StubAgent) -> None:
         """Unicode文字を含むメッセージが正しく処理されることを確認。"""
 
         async def mock_astream(user_input: str, session_id: str) -> AsyncIterator[tuple[str, None]]:
             yield ("こんにちは", None)
             yield ("世界", None)
 
-        mock_agent = MagicMock()
-        mock_agent.astream_response = mock_astream
+        stub_agent.astream_response = mock_astream
 
-        with patch("src.core.services.agent_service.ChatAgent", return_value=mock_agent):
-            service = AgentService()
+        service = AgentService()
 
-            chunks = []
-            async for chunk, _tool_exec in service.stream_message(session_id="test", message="テスト"):
-                chunks.append(chunk)
+        chunks = []
+        async for chunk, _tool_exec in service.stream_message(session_id="test", message="テスト"):
+            chunks.append(chunk)
 
-            assert len(chunks) == 2
-            assert chunks[0] == "こんにちは"
-            assert chunks[1] == "世界"
+        assert len(chunks) == 2
+        assert chunks[0] == "こんにちは"
+        assert chunks[1] == "世界"
@@ -0,0 +1,92 @@
+"""ツールのユニットテストで共有するフィクスチャ。"""
+
+from collections.abc import Iterator
+from types import MappingProxyType
+from typing import Any
+
+import duckdb
+import pytest
+
+# 気象庁APIの東京の予報レスポンス（実際のAPIレスポンスに近いモックデータ）
+_TOKYO_FORECAST_PAYLOAD = [
+    # data[0]: 詳細予報（3日分）
+    {
+        "publishingOffice": "気象庁",
+        "reportDatetime": "2025-10-21T11:00:00+09:00",
+        "timeSeries": [
+            {
+                "timeDefines": [
+                    "2025-10-22T00:00:00+09:00",
+                    "2025-10-23T00:00:00+09:00",
+                    "2025-10-24T00:00:00+09:00",
+                ],
+                "areas": [
+                    {
+                        "area": {"name": "東京地方", "code": "130010"},
+                        "weathers": ["くもり　夜　雨", "雨　昼前　から　くもり", "くもり　時々　晴れ"],
+                    }
+                ],
+            }
+        ],
+    },
+    # data[1]: 週間予報（7日分）
+    {
+        "publishingOffice": "気象庁",
+        "reportDatetime": "2025-10-21T11:00:00+09:00",
+        "timeSeries": [
+            {
+                "timeDefines": [
+                    "2025-10-22T00:00:00+09:00",
+                    "2025-10-23T00:00:00+09:00",
+                    "2025-10-24T00:00:00+09:00",
+                    "2025-10-25T00:00:00+09:00",
+                    "2025-10-26T00:00:00+09:00",
+                    "2025-10-27T00:00:00+09:00",
+                    "2025-10-28T00:00:00+09:00",
+                ],
+                "areas": [{"area": {"name": "東京地方", "code": "130010"}}],
+            },
+            {
+                "timeDefines": [
+                    "2025-10-22T00:00:00+09:00",
+                    "2025-10-23T00:00:00+09:00",
+                    "2025-10-24T00:00:00+09:00",
+                    "2025-10-25T00:00:00+09:00",
+                    "2025-10-26T00:00:00+09:00",
+                    "2025-10-27T00:00:00+09:00",
+                    "2025-10-28T00:00:00+09:00",
+                ],
+                "areas": [
+                    {
+                        "area": {"name": "東京", "code": "44132"},
+                        "tempsMin": ["", "12", "12", "12", "14", "16", "14"],
+                        "tempsMax": ["", "19", "20", "20", "19", "22", "20"],
+                    }
+                ],
+            },
+        ],
+    },
+]
+
+
+def _freeze(value: Any) -> Any:
+    """辞書をMappingProxyTypeに、リストをタプルに再帰的に変換して読み取り専用にする。"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="session")
+def duckdb_conn() -> Iterator[duckdb.DuckDBPyConnection]:
+    """商品・店舗検索ツールで共有するインメモリDuckDBコネクション。"""
+    con = duckdb.connect(":memory:")
+    yield con
+    con.close()
+
+
+@pytest.fixture(scope="session")
+def tokyo_forecast_payload() -> tuple[Any, ...]:
+    """天気ツールのテストで共有する読み取り専用の予報レスポンス（セッション内で1回だけ構築する）。"""
+    return _freeze(_TOKYO_FORECAST_PAYLOAD)
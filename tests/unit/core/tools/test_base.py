@@ -22,6 +22,12 @@ class ConcreteTestTool(BaseTool):
         return f"Executed with {kwargs}"
 
 
+@pytest.fixture(scope="class")
+def concrete_tool() -> ConcreteTestTool:
+    """状態を持たない具象ツールをクラス内で共有する。"""
+    return ConcreteTestTool()
+
+
 class TestBaseTool:
     """BaseToolの抽象基底クラスのテスト。"""
 
@@ -35,22 +41,19 @@ class TestBaseTool:
         tool = ConcreteTestTool()
         assert isinstance(tool, BaseTool)
 
-    def test_concrete_tool_has_name_property(self) -> None:
+    def test_concrete_tool_has_name_property(self, concrete_tool: ConcreteTestTool) -> None:
         """具象ツールがname プロパティを持つことを確認。"""
-        tool = ConcreteTestTool()
-        assert tool.name == "test_tool"
-        assert isinstance(tool.name, str)
+        assert concrete_tool.name == "test_tool"
+        assert isinstance(concrete_tool.name, str)
 
-    def test_concrete_tool_has_description_property(self) -> None:
+    def test_concrete_tool_has_description_property(self, concrete_tool: ConcreteTestTool) -> None:
         """具象ツールがdescriptionプロパティを持つことを確認。"""
-        tool = ConcreteTestTool()
-        assert tool.description == "A test tool for unit testing"
-        assert isinstance(tool.description, str)
+        assert concrete_tool.description == "A test tool for unit testing"
+        assert isinstance(concrete_tool.description, str)
 
-    def test_concrete_tool_can_execute(self) -> None:
+    def test_concrete_tool_can_execute(self, concrete_tool: ConcreteTestTool) -> None:
         """具象ツールがexecuteメソッドを実行できることを確認。"""
-        tool = ConcreteTestTool()
-        result = tool.execute(param1="value1", param2=42)
+        result = concrete_tool.execute(param1="value1", param2=42)
         assert "Executed with" in result
         assert "param1" in result
 
@@ -110,13 +113,11 @@ class TestBaseTool:
         with pytest.raises(TypeError):
             NoExecuteTool()  # type: ignore[abstract]
 
-    def test_execute_with_different_kwargs(self) -> None:
+    def test_execute_with_different_kwargs(self, concrete_tool: ConcreteTestTool) -> None:
         """executeメソッドが異なるkwargsで動作することを確認。"""
-        tool = ConcreteTestTool()
-
-        result1 = tool.execute()
-        result2 = tool.execute(a=1)
-        result3 = tool.execute(a=1, b=2, c="three")
+        result1 = concrete_tool.execute()
+        result2 = concrete_tool.execute(a=1)
+        result3 = concrete_tool.execute(a=1, b=2, c="three")
 
         assert isinstance(result1, str)
         assert isinstance(result2, str)
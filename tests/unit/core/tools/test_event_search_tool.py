@@ -1,29 +1,25 @@
 """EventSearchToolのユニットテスト。"""
 
+import re
+from operator import itemgetter
+
 import pytest
 
+from src.core.tools import _duckdb_sql as duckdb_sql_module
 from src.core.tools.event_search_tool import EventSearchTool
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_search_tool():
-    """EventSearchToolのフィクスチャ。"""
+    """EventSearchToolのフィクスチャ（状態を変更するテストはないためモジュール内で共有する）。"""
     return EventSearchTool()
 
 
+# 並列実行時もDuckDBコネクションとCSV読み込みを1ワーカー内で共有するため、同じワーカーに割り当てる
+@pytest.mark.xdist_group(name="event_duckdb")
 class TestEventSearchTool:
     """EventSearchToolのテストクラス。"""
 
-    def test_tool_name(self, event_search_tool):
-        """ツール名が正しいことを確認。"""
-        assert event_search_tool.name == "search_events"
-
-    def test_tool_description(self, event_search_tool):
-        """ツールの説明が存在することを確認。"""
-        assert len(event_search_tool.description) > 0
-        assert "search_events" in event_search_tool.description
-        assert "SQL" in event_search_tool.description
-
     def test_execute_valid_query(self, event_search_tool):
         """正常なSQLクエリが実行できることを確認。"""
         result = event_search_tool.execute(sql_query="SELECT * FROM 'events.csv' LIMIT 3")
@@ -32,6 +28,20 @@ class TestEventSearchTool:
         assert result["count"] == 3
         assert len(result["results"]) == 3
 
+    @pytest.mark.parametrize(
+        "query",
+        [
+            pytest.param("SELECT * FROM read_csv_auto('events.csv') LIMIT 3", id="read_csv_auto"),
+            pytest.param("SELECT * FROM read_csv('events.csv', header=true) LIMIT 3", id="read_csv_with_options"),
+            pytest.param('SELECT * FROM "events.csv" LIMIT 3', id="double_quoted"),
+        ],
+    )
+    def test_execute_csv_reference_forms(self, event_search_tool, query):
+        """CSV関数の呼び出しやダブルクォートでevents.csvを参照しても実行できることを確認。"""
+        result = event_search_tool.execute(sql_query=query)
+        assert "error" not in result
+        assert result["count"] == 3
+
     def test_execute_without_sql_query(self, event_search_tool):
         """SQLクエリなしで実行した場合のエラー処理を確認。"""
         result = event_search_tool.execute()
@@ -71,6 +81,33 @@ class TestEventSearchTool:
         assert is_valid is False
         assert "複数" in error
 
+    def test_validate_sql_precompiled_pattern_is_module_level(self, event_search_tool):
+        """検証用の正規表現がモジュールレベルでコンパイル済みであることを確認。"""
+        assert isinstance(duckdb_sql_module._FORBIDDEN_PATTERN, re.Pattern)
+        assert isinstance(duckdb_sql_module._LIMIT_PATTERN, re.Pattern)
+
+        # 部分一致（UPDATED_ATなど）は危険なキーワードとみなさない
+        is_valid, _ = event_search_tool._validate_sql("SELECT updated_at FROM 'events.csv'")
+        assert is_valid is True
+
+    @pytest.mark.parametrize(
+        "query,expected_group,expected_value",
+        [
+            pytest.param("SELECT * FROM EVENTS; DROP TABLE EVENTS", "keyword", "DROP", id="keyword_after_semicolon"),
+            pytest.param("SELECT * FROM EVENTS; SELECT 1", "multiple", "; S", id="multiple_queries"),
+            pytest.param("SELECT 1;X", "multiple", ";X", id="single_char_after_semicolon"),
+        ],
+    )
+    def test_forbidden_pattern_single_match(self, query, expected_group, expected_value):
+        """1つの正規表現でキーワードを優先しつつ複数クエリも検出できることを確認。"""
+        match = duckdb_sql_module._FORBIDDEN_PATTERN.match(query)
+        assert match is not None
+        assert match.group(expected_group) == expected_value
+
+    def test_forbidden_pattern_allows_trailing_semicolon(self):
+        """末尾のセミコロンのみの場合は禁止パターンに一致しないことを確認。"""
+        assert duckdb_sql_module._FORBIDDEN_PATTERN.match("SELECT * FROM EVENTS;") is None
+
     def test_ensure_limit_no_limit(self, event_search_tool):
         """LIMIT句がない場合に追加されることを確認。"""
         query = "SELECT * FROM 'events.csv'"
@@ -110,7 +147,7 @@ class TestEventSearchTool:
         assert "results" in result
         # BMWを含むイベントが存在する場合
         if result["count"] > 0:
-            assert any("BMW" in r.get("event_name", "") for r in result["results"])
+            assert "BMW" in " ".join(map(itemgetter("event_name"), result["results"]))
 
     def test_execute_with_order_by(self, event_search_tool):
         """ORDER BY句を含むクエリが実行できることを確認。"""
@@ -125,12 +162,11 @@ class TestEventSearchTool:
         assert result["count"] == 3
         # 結果に指定したカラムが含まれることを確認
         if len(result["results"]) > 0:
-            assert "event_name" in result["results"][0]
-            assert "date_time" in result["results"][0]
+            assert {"event_name", "date_time"} <= result["results"][0].keys()
 
-    def test_execute_dangerous_keywords_blocked(self, event_search_tool):
-        """危険なキーワードを含むクエリがブロックされることを確認。"""
-        dangerous_queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "DROP TABLE events",
             "UPDATE events SET name='x'",
             "DELETE FROM events",
@@ -138,11 +174,22 @@ class TestEventSearchTool:
             "ALTER TABLE events ADD COLUMN x",
             "CREATE TABLE test (id INT)",
             "TRUNCATE TABLE events",
-        ]
-
-        for query in dangerous_queries:
-            result = event_search_tool.execute(sql_query=query)
-            assert "error" in result, f"Query should be blocked: {query}"
+        ],
+    )
+    def test_execute_dangerous_keyword_blocked(self, event_search_tool, query):
+        """危険なキーワードを含むクエリがブロックされることを確認。"""
+        result = event_search_tool.execute(sql_query=query)
+        assert "error" in result, f"Query should be blocked: {query}"
+
+    def test_execute_reuses_connection(self, event_search_tool):
+        """CSVを読み込んだコネクションが複数クエリで使い回されることを確認。"""
+        event_search_tool.execute(sql_query="SELECT event_name FROM 'events.csv' LIMIT 1")
+        connection = event_search_tool._connection
+        result = event_search_tool.execute(sql_query="SELECT event_name FROM read_csv('events.csv') LIMIT 1")
+
+        assert connection is not None
+        assert event_search_tool._connection is connection
+        assert result["count"] == 1
 
     def test_execute_empty_result(self, event_search_tool):
         """結果が0件の場合も正しく処理されることを確認。"""
@@ -1,29 +1,35 @@
 """ProductSearchToolのユニットテスト。"""
 
+from operator import itemgetter
+from unittest.mock import patch
+
+import duckdb
 import pytest
 
+from src.core.tools import _duckdb_sql as duckdb_sql_module
 from src.core.tools.product_search_tool import ProductSearchTool
 
 
-@pytest.fixture
-def product_search_tool():
-    """ProductSearchToolのフィクスチャ。"""
+@pytest.fixture(scope="module")
+def product_search_tool(duckdb_conn):
+    """ProductSearchToolのフィクスチャ（状態を変更するテストはないためモジュール内で共有する）。
+
+    DuckDBコネクションは他の検索ツールのテストとセッション全体で共有する。
+    """
+    return ProductSearchTool(connection=duckdb_conn)
+
+
+@pytest.fixture(scope="module")
+def sql_validator():
+    """SQLの検証・LIMIT調整専用のProductSearchTool（クエリを実行しないためDuckDBコネクションを持たない）。"""
     return ProductSearchTool()
 
 
+# 並列実行時もDuckDBコネクションとCSV読み込みを1ワーカー内で共有するため、同じワーカーに割り当てる
+@pytest.mark.xdist_group(name="product_duckdb")
 class TestProductSearchTool:
     """ProductSearchToolのテストクラス。"""
 
-    def test_tool_name(self, product_search_tool):
-        """ツール名が正しいことを確認。"""
-        assert product_search_tool.name == "search_products"
-
-    def test_tool_description(self, product_search_tool):
-        """ツールの説明が存在することを確認。"""
-        assert len(product_search_tool.description) > 0
-        assert "search_products" in product_search_tool.description
-        assert "SQL" in product_search_tool.description
-
     def test_execute_valid_query(self, product_search_tool):
         """正常なSQLクエリが実行できることを確認。"""
         result = product_search_tool.execute(sql_query="SELECT * FROM 'filtered_product_data.csv' LIMIT 3")
@@ -32,70 +38,87 @@ class TestProductSearchTool:
         assert result["count"] == 3
         assert len(result["results"]) == 3
 
+    @pytest.mark.parametrize(
+        "query",
+        [
+            pytest.param("SELECT * FROM read_csv_auto('filtered_product_data.csv') LIMIT 3", id="read_csv_auto"),
+            pytest.param(
+                "SELECT * FROM read_csv('filtered_product_data.csv', header=true) LIMIT 3", id="read_csv_with_options"
+            ),
+            pytest.param('SELECT * FROM "filtered_product_data.csv" LIMIT 3', id="double_quoted"),
+        ],
+    )
+    def test_execute_csv_reference_forms(self, product_search_tool, query):
+        """CSV関数の呼び出しやダブルクォートでfiltered_product_data.csvを参照しても実行できることを確認。"""
+        result = product_search_tool.execute(sql_query=query)
+        assert "error" not in result
+        assert result["count"] == 3
+
     def test_execute_without_sql_query(self, product_search_tool):
         """SQLクエリなしで実行した場合のエラー処理を確認。"""
         result = product_search_tool.execute()
         assert "error" in result
         assert "SQLクエリを指定してください" in result["error"]
 
-    def test_validate_sql_select_query(self, product_search_tool):
-        """SELECT文の検証が正しく動作することを確認。"""
-        is_valid, _ = product_search_tool._validate_sql("SELECT * FROM 'filtered_product_data.csv'")
-        assert is_valid is True
-
-    def test_validate_sql_non_select_query(self, product_search_tool):
-        """SELECT以外の文が拒否されることを確認。"""
-        is_valid, error = product_search_tool._validate_sql("INSERT INTO products VALUES (1)")
-        assert is_valid is False
-        assert "SELECT文のみ" in error
-
-    def test_validate_sql_drop_query(self, product_search_tool):
-        """DROP文が拒否されることを確認。"""
-        is_valid, error = product_search_tool._validate_sql("SELECT * FROM products; DROP TABLE products")
-        assert is_valid is False
-        assert "DROP" in error or "複数" in error
-
-    def test_validate_sql_update_query(self, product_search_tool):
-        """UPDATE文が拒否されることを確認。"""
-        is_valid, error = product_search_tool._validate_sql("UPDATE products SET name='test'")
-        assert is_valid is False
-
-    def test_validate_sql_delete_query(self, product_search_tool):
-        """DELETE文が拒否されることを確認。"""
-        is_valid, error = product_search_tool._validate_sql("DELETE FROM products")
-        assert is_valid is False
-
-    def test_validate_sql_multiple_queries(self, product_search_tool):
-        """複数クエリが拒否されることを確認。"""
-        is_valid, error = product_search_tool._validate_sql("SELECT * FROM products; SELECT * FROM products;")
-        assert is_valid is False
-        assert "複数" in error
-
-    def test_ensure_limit_no_limit(self, product_search_tool):
-        """LIMIT句がない場合に追加されることを確認。"""
-        query = "SELECT * FROM 'filtered_product_data.csv'"
-        result_query = product_search_tool._ensure_limit(query)
-        assert "LIMIT 10" in result_query
-
-    def test_ensure_limit_with_limit_5(self, product_search_tool):
-        """LIMIT 5がそのまま保持されることを確認。"""
-        query = "SELECT * FROM 'filtered_product_data.csv' LIMIT 5"
-        result_query = product_search_tool._ensure_limit(query)
-        assert "LIMIT 5" in result_query or "LIMIT 10" in result_query
-        # LIMIT 5はそのままか、10に調整される可能性がある
-
-    def test_ensure_limit_with_limit_100(self, product_search_tool):
-        """LIMIT 100がLIMIT 10に調整されることを確認。"""
-        query = "SELECT * FROM 'filtered_product_data.csv' LIMIT 100"
-        result_query = product_search_tool._ensure_limit(query)
-        assert "LIMIT 10" in result_query
-        assert "LIMIT 100" not in result_query
-
-    def test_ensure_limit_case_insensitive(self, product_search_tool):
-        """LIMITの大文字小文字を区別しないことを確認。"""
-        query = "SELECT * FROM 'filtered_product_data.csv' limit 50"
-        result_query = product_search_tool._ensure_limit(query)
-        assert "LIMIT 10" in result_query.upper()
+    @pytest.mark.parametrize(
+        ("query", "expected_valid", "expected_error"),
+        [
+            pytest.param("SELECT * FROM 'filtered_product_data.csv'", True, "", id="select"),
+            pytest.param("INSERT INTO products VALUES (1)", False, "SELECT文のみ", id="non_select"),
+            pytest.param("SELECT * FROM products; DROP TABLE products", False, "DROP", id="drop"),
+            pytest.param("UPDATE products SET name='test'", False, "", id="update"),
+            pytest.param("DELETE FROM products", False, "", id="delete"),
+            pytest.param("SELECT * FROM products; SELECT * FROM products;", False, "複数", id="multiple_queries"),
+        ],
+    )
+    def test_validate_sql(self, sql_validator, query, expected_valid, expected_error):
+        """SQLの検証結果とエラーメッセージが正しいことを確認。"""
+        is_valid, error = sql_validator._validate_sql(query)
+        assert is_valid is expected_valid
+        assert expected_error in error
+        # 検証だけではDuckDBコネクションを作成しない
+        assert sql_validator._connection is None
+
+    @pytest.mark.parametrize(
+        ("query", "expected_suffix"),
+        [
+            pytest.param("SELECT * FROM 'filtered_product_data.csv'", "LIMIT 10", id="no_limit"),
+            pytest.param("SELECT * FROM 'filtered_product_data.csv' LIMIT 5", "LIMIT 5", id="limit_5_kept"),
+            pytest.param("SELECT * FROM 'filtered_product_data.csv' LIMIT 100", "LIMIT 10", id="limit_100_capped"),
+            pytest.param("SELECT * FROM 'filtered_product_data.csv' limit 50", "LIMIT 10", id="case_insensitive"),
+        ],
+    )
+    def test_ensure_limit(self, sql_validator, query, expected_suffix):
+        """LIMIT句が追加または10以下に調整されることを確認。"""
+        result_query = sql_validator._ensure_limit(query)
+        assert result_query.upper().endswith(expected_suffix)
+        assert sql_validator._connection is None
+
+    def test_ensure_limit_caches_repeated_queries(self, sql_validator):
+        """同じクエリのLIMIT調整結果がキャッシュから返されることを確認。"""
+        duckdb_sql_module._apply_limit.cache_clear()
+        query = "SELECT * FROM products WHERE store_name LIKE '%麻布台%'"
+
+        first = sql_validator._ensure_limit(query)
+        second = sql_validator._ensure_limit(query)
+
+        assert first is second
+        assert duckdb_sql_module._apply_limit.cache_info().hits == 1
+
+    def test_ensure_limit_logs_on_cache_hit(self, sql_validator, caplog):
+        """キャッシュヒット時もLIMIT調整のログが出力されることを確認。"""
+        duckdb_sql_module._apply_limit.cache_clear()
+        query = "SELECT * FROM products LIMIT 100"
+        # ロガーはpropagate=Falseのため、キャプチャ用ハンドラーを直接追加する
+        duckdb_sql_module.logger.addHandler(caplog.handler)
+        try:
+            sql_validator._ensure_limit(query)
+            sql_validator._ensure_limit(query)
+        finally:
+            duckdb_sql_module.logger.removeHandler(caplog.handler)
+
+        assert duckdb_sql_module._apply_limit.cache_info().hits == 1
+        assert [record.getMessage() for record in caplog.records] == ["LIMIT adjusted from 100 to 10"] * 2
 
     def test_execute_with_limit_enforcement(self, product_search_tool):
         """実際のクエリでLIMIT制約が適用されることを確認。"""
@@ -112,7 +135,8 @@ class TestProductSearchTool:
         assert "results" in result
         # ギフトカテゴリの商品が存在する場合
         if result["count"] > 0:
-            assert all(r.get("tag") == "ギフト" for r in result["results"])
+            tags = list(map(itemgetter("tag"), result["results"]))
+            assert tags == ["ギフト"] * len(tags)
 
     def test_execute_with_order_by(self, product_search_tool):
         """ORDER BY句を含むクエリが実行できることを確認。"""
@@ -131,12 +155,11 @@ class TestProductSearchTool:
         assert result["count"] == 3
         # 結果に指定したカラムが含まれることを確認
         if len(result["results"]) > 0:
-            assert "product_name" in result["results"][0]
-            assert "tag" in result["results"][0]
+            assert {"product_name", "tag"} <= result["results"][0].keys()
 
-    def test_execute_dangerous_keywords_blocked(self, product_search_tool):
-        """危険なキーワードを含むクエリがブロックされることを確認。"""
-        dangerous_queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "DROP TABLE products",
             "UPDATE products SET name='x'",
             "DELETE FROM products",
@@ -144,15 +167,26 @@ class TestProductSearchTool:
             "ALTER TABLE products ADD COLUMN x",
             "CREATE TABLE test (id INT)",
             "TRUNCATE TABLE products",
-        ]
+        ],
+    )
+    def test_execute_dangerous_keyword_blocked(self, product_search_tool, query):
+        """危険なキーワードを含むクエリがブロックされることを確認。"""
+        result = product_search_tool.execute(sql_query=query)
+        assert "error" in result, f"Query should be blocked: {query}"
 
-        for query in dangerous_queries:
-            result = product_search_tool.execute(sql_query=query)
-            assert "error" in result, f"Query should be blocked: {query}"
+    def test_execute_dangerous_keyword_rejected_before_duckdb(self, sql_validator):
+        """危険なクエリはDuckDBに渡す前に拒否されることを確認。"""
+        with patch.object(duckdb, "connect") as mock_connect:
+            result = sql_validator.execute(sql_query="SELECT * FROM products; DROP TABLE products")
 
-    def test_execute_empty_result(self, product_search_tool):
-        """結果が0件の場合も正しく処理されることを確認。"""
-        result = product_search_tool.execute(
+        assert "error" in result
+        mock_connect.assert_not_called()
+        assert sql_validator._connection is None
+
+    def test_execute_empty_result(self, sql_validator, monkeypatch):
+        """結果が0件の場合も正しく処理されることを確認（クエリ実行はスタブに置き換える）。"""
+        monkeypatch.setattr(sql_validator, "_execute_duckdb_query", lambda sql_query: [])
+        result = sql_validator.execute(
             sql_query=(
                 "SELECT * FROM 'filtered_product_data.csv' " "WHERE product_name = 'NONEXISTENT_PRODUCT_12345' LIMIT 10"
             )
@@ -161,6 +195,15 @@ class TestProductSearchTool:
         assert result["count"] == 0
         assert len(result["results"]) == 0
 
+    def test_execute_empty_result_from_table(self, product_search_tool):
+        """読み込み済みテーブルに実際にクエリを実行し、一致しない条件で0件が返ることを確認。"""
+        result = product_search_tool.execute(
+            sql_query="SELECT * FROM 'filtered_product_data.csv' WHERE product_name = 'NONEXISTENT_PRODUCT_12345'"
+        )
+        assert "error" not in result
+        assert result["count"] == 0
+        assert result["results"] == []
+
     def test_execute_with_like_operator(self, product_search_tool):
         """LIKE演算子を使った検索が正しく動作することを確認。"""
         result = product_search_tool.execute(
@@ -169,7 +212,7 @@ class TestProductSearchTool:
         assert "results" in result
         # 寿司を含む商品が存在する場合
         if result["count"] > 0:
-            assert any("寿司" in r.get("product_name", "") for r in result["results"])
+            assert "寿司" in " ".join(map(itemgetter("product_name"), result["results"]))
 
     def test_execute_with_price_search(self, product_search_tool):
         """価格情報での検索が可能なことを確認。"""
@@ -188,9 +231,25 @@ class TestProductSearchTool:
         assert result["count"] == 1
 
         # 最初の結果に必要なカラムが含まれているか確認
-        first_result = result["results"][0]
-        assert "store_id" in first_result
-        assert "store_name" in first_result
-        assert "product_name" in first_result
-        assert "product_description" in first_result
-        assert "tag" in first_result
+        expected_columns = {"store_id", "store_name", "product_name", "product_description", "tag"}
+        assert expected_columns <= result["results"][0].keys()
+
+    def test_execute_reuses_connection(self, product_search_tool):
+        """CSVを読み込んだコネクションが複数クエリで使い回されることを確認。"""
+        product_search_tool.execute(sql_query="SELECT product_name FROM 'filtered_product_data.csv' LIMIT 1")
+        connection = product_search_tool._connection
+        result = product_search_tool.execute(
+            sql_query="SELECT product_name FROM read_csv('filtered_product_data.csv') LIMIT 1"
+        )
+
+        assert connection is not None
+        assert product_search_tool._connection is connection
+        assert result["count"] == 1
+
+    def test_execute_uses_injected_connection(self, product_search_tool, duckdb_conn):
+        """注入されたコネクションにテーブルが作成されることを確認。"""
+        product_search_tool.execute(sql_query="SELECT * FROM 'filtered_product_data.csv' LIMIT 1")
+
+        assert product_search_tool._connection is duckdb_conn
+        tables = {row[0] for row in duckdb_conn.execute("SHOW TABLES").fetchall()}
+        assert "products" in tables
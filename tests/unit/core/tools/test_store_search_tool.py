@@ -1,29 +1,35 @@
 """StoreSearchToolのユニットテスト。"""
 
+from operator import itemgetter
+from unittest.mock import patch
+
+import duckdb
 import pytest
 
+from src.core.tools import _duckdb_sql as duckdb_sql_module
 from src.core.tools.store_search_tool import StoreSearchTool
 
 
-@pytest.fixture
-def store_search_tool():
-    """StoreSearchToolのフィクスチャ。"""
+@pytest.fixture(scope="module")
+def store_search_tool(duckdb_conn):
+    """StoreSearchToolのフィクスチャ（状態を変更するテストはないためモジュール内で共有する）。
+
+    DuckDBコネクションは他の検索ツールのテストとセッション全体で共有する。
+    """
+    return StoreSearchTool(connection=duckdb_conn)
+
+
+@pytest.fixture(scope="module")
+def sql_validator():
+    """SQLの検証・LIMIT調整専用のStoreSearchTool（クエリを実行しないためDuckDBコネクションを持たない）。"""
     return StoreSearchTool()
 
 
+# 並列実行時もDuckDBコネクションとCSV読み込みを1ワーカー内で共有するため、同じワーカーに割り当てる
+@pytest.mark.xdist_group(name="store_duckdb")
 class TestStoreSearchTool:
     """StoreSearchToolのテストクラス。"""
 
-    def test_tool_name(self, store_search_tool):
-        """ツール名が正しいことを確認。"""
-        assert store_search_tool.name == "search_stores"
-
-    def test_tool_description(self, store_search_tool):
-        """ツールの説明が存在することを確認。"""
-        assert len(store_search_tool.description) > 0
-        assert "search_stores" in store_search_tool.description
-        assert "SQL" in store_search_tool.description
-
     def test_execute_valid_query(self, store_search_tool):
         """正常なSQLクエリが実行できることを確認。"""
         result = store_search_tool.execute(sql_query="SELECT * FROM 'stores.csv' LIMIT 3")
@@ -32,70 +38,70 @@ class TestStoreSearchTool:
         assert result["count"] == 3
         assert len(result["results"]) == 3
 
+    @pytest.mark.parametrize(
+        "query",
+        [
+            pytest.param("SELECT * FROM read_csv_auto('stores.csv') LIMIT 3", id="read_csv_auto"),
+            pytest.param("SELECT * FROM read_csv('stores.csv', header=true) LIMIT 3", id="read_csv_with_options"),
+            pytest.param('SELECT * FROM "stores.csv" LIMIT 3', id="double_quoted"),
+        ],
+    )
+    def test_execute_csv_reference_forms(self, store_search_tool, query):
+        """CSV関数の呼び出しやダブルクォートでstores.csvを参照しても実行できることを確認。"""
+        result = store_search_tool.execute(sql_query=query)
+        assert "error" not in result
+        assert result["count"] == 3
+
     def test_execute_without_sql_query(self, store_search_tool):
         """SQLクエリなしで実行した場合のエラー処理を確認。"""
         result = store_search_tool.execute()
         assert "error" in result
         assert "SQLクエリを指定してください" in result["error"]
 
-    def test_validate_sql_select_query(self, store_search_tool):
-        """SELECT文の検証が正しく動作することを確認。"""
-        is_valid, _ = store_search_tool._validate_sql("SELECT * FROM 'stores.csv'")
-        assert is_valid is True
-
-    def test_validate_sql_non_select_query(self, store_search_tool):
-        """SELECT以外の文が拒否されることを確認。"""
-        is_valid, error = store_search_tool._validate_sql("INSERT INTO stores VALUES (1)")
-        assert is_valid is False
-        assert "SELECT文のみ" in error
-
-    def test_validate_sql_drop_query(self, store_search_tool):
-        """DROP文が拒否されることを確認。"""
-        is_valid, error = store_search_tool._validate_sql("SELECT * FROM stores; DROP TABLE stores")
-        assert is_valid is False
-        assert "DROP" in error or "複数" in error
-
-    def test_validate_sql_update_query(self, store_search_tool):
-        """UPDATE文が拒否されることを確認。"""
-        is_valid, error = store_search_tool._validate_sql("UPDATE stores SET name='test'")
-        assert is_valid is False
-
-    def test_validate_sql_delete_query(self, store_search_tool):
-        """DELETE文が拒否されることを確認。"""
-        is_valid, error = store_search_tool._validate_sql("DELETE FROM stores")
-        assert is_valid is False
-
-    def test_validate_sql_multiple_queries(self, store_search_tool):
-        """複数クエリが拒否されることを確認。"""
-        is_valid, error = store_search_tool._validate_sql("SELECT * FROM stores; SELECT * FROM stores;")
-        assert is_valid is False
-        assert "複数" in error
-
-    def test_ensure_limit_no_limit(self, store_search_tool):
-        """LIMIT句がない場合に追加されることを確認。"""
-        query = "SELECT * FROM 'stores.csv'"
-        result_query = store_search_tool._ensure_limit(query)
-        assert "LIMIT 10" in result_query
-
-    def test_ensure_limit_with_limit_5(self, store_search_tool):
-        """LIMIT 5がそのまま保持されることを確認。"""
-        query = "SELECT * FROM 'stores.csv' LIMIT 5"
-        result_query = store_search_tool._ensure_limit(query)
-        assert "LIMIT 5" in result_query or "LIMIT 10" in result_query
-        # LIMIT 5はそのままか、10に調整される可能性がある
-
-    def test_ensure_limit_with_limit_100(self, store_search_tool):
-        """LIMIT 100がLIMIT 10に調整されることを確認。"""
-        query = "SELECT * FROM 'stores.csv' LIMIT 100"
-        result_query = store_search_tool._ensure_limit(query)
-        assert "LIMIT 10" in result_query
-        assert "LIMIT 100" not in result_query
-
-    def test_ensure_limit_case_insensitive(self, store_search_tool):
-        """LIMITの大文字小文字を区別しないことを確認。"""
-        query = "SELECT * FROM 'stores.csv' limit 50"
-        result_query = store_search_tool._ensure_limit(query)
-        assert "LIMIT 10" in result_query.upper()
+    @pytest.mark.parametrize(
+        ("query", "expected_valid", "expected_error"),
+        [
+            pytest.param("SELECT * FROM 'stores.csv'", True, "", id="select"),
+            pytest.param("INSERT INTO stores VALUES (1)", False, "SELECT文のみ", id="non_select"),
+            pytest.param("SELECT * FROM stores; DROP TABLE stores", False, "DROP", id="drop"),
+            pytest.param("UPDATE stores SET name='test'", False, "", id="update"),
+            pytest.param("DELETE FROM stores", False, "", id="delete"),
+            pytest.param("SELECT * FROM stores; SELECT * FROM stores;", False, "複数", id="multiple_queries"),
+        ],
+    )
+    def test_validate_sql(self, sql_validator, query, expected_valid, expected_error):
+        """SQLの検証結果とエラーメッセージが正しいことを確認。"""
+        is_valid, error = sql_validator._validate_sql(query)
+        assert is_valid is expected_valid
+        assert expected_error in error
+        # 検証だけではDuckDBコネクションを作成しない
+        assert sql_validator._connection is None
+
+    @pytest.mark.parametrize(
+        ("query", "expected_suffix"),
+        [
+            pytest.param("SELECT * FROM 'stores.csv'", "LIMIT 10", id="no_limit"),
+            pytest.param("SELECT * FROM 'stores.csv' LIMIT 5", "LIMIT 5", id="limit_5_kept"),
+            pytest.param("SELECT * FROM 'stores.csv' LIMIT 100", "LIMIT 10", id="limit_100_capped"),
+            pytest.param("SELECT * FROM 'stores.csv' limit 50", "LIMIT 10", id="case_insensitive"),
+        ],
+    )
+    def test_ensure_limit(self, sql_validator, query, expected_suffix):
+        """LIMIT句が追加または10以下に調整されることを確認。"""
+        result_query = sql_validator._ensure_limit(query)
+        assert result_query.upper().endswith(expected_suffix)
+        assert sql_validator._connection is None
+
+    def test_ensure_limit_caches_repeated_queries(self, sql_validator):
+        """同じクエリのLIMIT調整結果がキャッシュから返されることを確認。"""
+        duckdb_sql_module._apply_limit.cache_clear()
+        query = "SELECT * FROM stores WHERE store_name LIKE '%麻布台%'"
+
+        first = sql_validator._ensure_limit(query)
+        second = sql_validator._ensure_limit(query)
+
+        assert first is second
+        assert duckdb_sql_module._apply_limit.cache_info().hits == 1
 
     def test_execute_with_limit_enforcement(self, store_search_tool):
         """実際のクエリでLIMIT制約が適用されることを確認。"""
@@ -112,7 +118,7 @@ class TestStoreSearchTool:
         assert "results" in result
         # ヒルズを含む店舗が存在する場合
         if result["count"] > 0:
-            assert any("ヒルズ" in r.get("store_name", "") for r in result["results"])
+            assert "ヒルズ" in " ".join(map(itemgetter("store_name"), result["results"]))
 
     def test_execute_with_order_by(self, store_search_tool):
         """ORDER BY句を含むクエリが実行できることを確認。"""
@@ -127,12 +133,11 @@ class TestStoreSearchTool:
         assert result["count"] == 3
         # 結果に指定したカラムが含まれることを確認
         if len(result["results"]) > 0:
-            assert "store_name" in result["results"][0]
-            assert "category" in result["results"][0]
+            assert {"store_name", "category"} <= result["results"][0].keys()
 
-    def test_execute_dangerous_keywords_blocked(self, store_search_tool):
-        """危険なキーワードを含むクエリがブロックされることを確認。"""
-        dangerous_queries = [
+    @pytest.mark.parametrize(
+        "query",
+        [
             "DROP TABLE stores",
             "UPDATE stores SET name='x'",
             "DELETE FROM stores",
@@ -140,15 +145,26 @@ class TestStoreSearchTool:
             "ALTER TABLE stores ADD COLUMN x",
             "CREATE TABLE test (id INT)",
             "TRUNCATE TABLE stores",
-        ]
+        ],
+    )
+    def test_execute_dangerous_keyword_blocked(self, store_search_tool, query):
+        """危険なキーワードを含むクエリがブロックされることを確認。"""
+        result = store_search_tool.execute(sql_query=query)
+        assert "error" in result, f"Query should be blocked: {query}"
 
-        for query in dangerous_queries:
-            result = store_search_tool.execute(sql_query=query)
-            assert "error" in result, f"Query should be blocked: {query}"
+    def test_execute_dangerous_keyword_rejected_before_duckdb(self, sql_validator):
+        """危険なクエリはDuckDBに渡す前に拒否されることを確認。"""
+        with patch.object(duckdb, "connect") as mock_connect:
+            result = sql_validator.execute(sql_query="SELECT * FROM stores; DROP TABLE stores")
 
-    def test_execute_empty_result(self, store_search_tool):
-        """結果が0件の場合も正しく処理されることを確認。"""
-        result = store_search_tool.execute(
+        assert "error" in result
+        mock_connect.assert_not_called()
+        assert sql_validator._connection is None
+
+    def test_execute_empty_result(self, sql_validator, monkeypatch):
+        """結果が0件の場合も正しく処理されることを確認（クエリ実行はスタブに置き換える）。"""
+        monkeypatch.setattr(sql_validator, "_execute_duckdb_query", lambda sql_query: [])
+        result = sql_validator.execute(
             sql_query="SELECT * FROM 'stores.csv' WHERE store_name = 'NONEXISTENT_STORE_12345' LIMIT 10"
         )
         assert "results" in result
@@ -158,6 +174,16 @@ class TestStoreSearchTool:
         assert "message" in result
         assert "見つかりませんでした" in result["message"]
 
+    def test_execute_empty_result_from_table(self, store_search_tool):
+        """読み込み済みテーブルに実際にクエリを実行し、一致しない条件で0件が返ることを確認。"""
+        result = store_search_tool.execute(
+            sql_query="SELECT * FROM 'stores.csv' WHERE store_name = 'NONEXISTENT_STORE_12345'"
+        )
+        assert "error" not in result
+        assert result["count"] == 0
+        assert result["results"] == []
+        assert "見つかりませんでした" in result["message"]
+
     def test_execute_search_by_category(self, store_search_tool):
         """カテゴリで検索できることを確認。"""
         result = store_search_tool.execute(
@@ -166,7 +192,8 @@ class TestStoreSearchTool:
         assert "results" in result
         # retailカテゴリの店舗が存在する場合
         if result["count"] > 0:
-            assert all(r.get("category") == "retail" for r in result["results"])
+            categories = list(map(itemgetter("category"), result["results"]))
+            assert categories == ["retail"] * len(categories)
 
     def test_execute_search_with_json_field(self, store_search_tool):
         """JSON形式のフィールドで検索できることを確認（駐車場がある店舗）。"""
@@ -198,3 +225,23 @@ class TestStoreSearchTool:
         # 麻布台エリアの店舗が存在する場合
         if result["count"] > 0:
             assert all("麻布台" in r.get("address", "") for r in result["results"])
+
+    def test_execute_reuses_connection_and_store_urls(self, store_search_tool):
+        """CSVを読み込んだコネクションと店舗URLが複数クエリで使い回されることを確認。"""
+        store_search_tool.execute(sql_query="SELECT store_id FROM 'stores.csv' LIMIT 1")
+        connection = store_search_tool._connection
+        store_urls = store_search_tool._store_urls
+        result = store_search_tool.execute(sql_query="SELECT store_id FROM read_csv('stores.csv') LIMIT 1")
+
+        assert connection is not None
+        assert store_search_tool._connection is connection
+        assert store_search_tool._store_urls is store_urls
+        assert "web_url" in result["results"][0]
+
+    def test_execute_uses_injected_connection(self, store_search_tool, duckdb_conn):
+        """注入されたコネクションにテーブルが作成されることを確認。"""
+        store_search_tool.execute(sql_query="SELECT * FROM 'stores.csv' LIMIT 1")
+
+        assert store_search_tool._connection is duckdb_conn
+        tables = {row[0] for row in duckdb_conn.execute("SHOW TABLES").fetchall()}
+        assert "stores" in tables
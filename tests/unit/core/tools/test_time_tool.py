@@ -1,27 +1,38 @@
 """GetCurrentTimeToolのユニットテスト。"""
 
-from datetime import datetime
-from unittest.mock import patch
+import re
+from datetime import datetime, timezone, tzinfo
+from typing import Optional
 
-import pytz
+import pytest
 
 from src.core.tools.time_tool import GetCurrentTimeTool
 
+# ツールが返す "YYYY-MM-DD HH:MM:SS (曜日)" 形式（実際の日付としての妥当性は東京のテストでstrptimeにより確認する）
+_RESULT_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} \([月火水木金土日]曜日\)$")
 
-class TestGetCurrentTimeTool:
-    """GetCurrentTimeToolのテスト。"""
+# テスト中の現在時刻（UTC）。東京では2025年3月15日（土曜日）14:30:45
+_FIXED_UTC = datetime(2025, 3, 15, 5, 30, 45, tzinfo=timezone.utc)
 
-    def test_time_tool_name(self) -> None:
-        """ツール名が正しいことを確認。"""
-        tool = GetCurrentTimeTool()
-        assert tool.name == "get_current_time"
 
-    def test_time_tool_description(self) -> None:
-        """ツールの説明が正しいことを確認。"""
-        tool = GetCurrentTimeTool()
-        assert "タイムゾーン" in tool.description
-        assert "現在時刻" in tool.description
-        assert tool.description != ""
+class _FrozenDatetime(datetime):
+    """now()が常に固定時刻を返すdatetime。"""
+
+    @classmethod
+    def now(cls, tz: Optional[tzinfo] = None) -> datetime:  # type: ignore[override]
+        if tz is None:
+            return _FIXED_UTC.replace(tzinfo=None)
+        return _FIXED_UTC.astimezone(tz)
+
+
+@pytest.fixture(autouse=True)
+def _freeze_time_tool_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """time_toolが参照するdatetimeを固定時刻に差し替え、結果を決定的にする。"""
+    monkeypatch.setattr("src.core.tools.time_tool.datetime", _FrozenDatetime)
+
+
+class TestGetCurrentTimeTool:
+    """GetCurrentTimeToolのテスト。"""
 
     def test_get_current_time_tokyo(self) -> None:
         """東京のタイムゾーンで現在時刻を取得できることを確認。"""
@@ -35,6 +46,7 @@ class TestGetCurrentTimeTool:
         assert " (" in result and ")" in result
         time_part = result.split(" (")[0]
         datetime.strptime(time_part, "%Y-%m-%d %H:%M:%S")
+        assert result == "2025-03-15 14:30:45 (土曜日)"
 
     def test_get_current_time_new_york(self) -> None:
         """ニューヨークのタイムゾーンで現在時刻を取得できることを確認。"""
@@ -42,8 +54,9 @@ class TestGetCurrentTimeTool:
         result = tool.execute(timezone="America/New_York")
 
         assert isinstance(result, str)
-        time_part = result.split(" (")[0]
-        datetime.strptime(time_part, "%Y-%m-%d %H:%M:%S")
+        assert _RESULT_PATTERN.match(result)
+        # 3月15日は夏時間（UTC-4）
+        assert result == "2025-03-15 01:30:45 (土曜日)"
 
     def test_get_current_time_utc(self) -> None:
         """UTCタイムゾーンで現在時刻を取得できることを確認。"""
@@ -51,8 +64,8 @@ class TestGetCurrentTimeTool:
         result = tool.execute(timezone="UTC")
 
         assert isinstance(result, str)
-        time_part = result.split(" (")[0]
-        datetime.strptime(time_part, "%Y-%m-%d %H:%M:%S")
+        assert _RESULT_PATTERN.match(result)
+        assert result == "2025-03-15 05:30:45 (土曜日)"
 
     def test_get_current_time_london(self) -> None:
         """ロンドンのタイムゾーンで現在時刻を取得できることを確認。"""
@@ -60,8 +73,8 @@ class TestGetCurrentTimeTool:
         result = tool.execute(timezone="Europe/London")
 
         assert isinstance(result, str)
-        time_part = result.split(" (")[0]
-        datetime.strptime(time_part, "%Y-%m-%d %H:%M:%S")
+        assert _RESULT_PATTERN.match(result)
+        assert result == "2025-03-15 05:30:45 (土曜日)"
 
     def test_get_current_time_invalid_timezone(self) -> None:
         """無効なタイムゾーンでエラーメッセージを返すことを確認。"""
@@ -82,14 +95,11 @@ class TestGetCurrentTimeTool:
     def test_get_current_time_format(self) -> None:
         """返される時刻のフォーマットが正しいことを確認。"""
         tool = GetCurrentTimeTool()
-        mock_time = datetime(2025, 3, 15, 14, 30, 45)  # 2025年3月15日は土曜日
-
-        with patch("src.core.tools.time_tool.datetime") as mock_datetime:
-            mock_datetime.now.return_value = mock_time.replace(tzinfo=pytz.timezone("Asia/Tokyo"))
-            result = tool.execute(timezone="Asia/Tokyo")
+        # 固定時刻は東京で2025年3月15日（土曜日）14:30:45
+        result = tool.execute(timezone="Asia/Tokyo")
 
-            assert isinstance(result, str)
-            assert result == "2025-03-15 14:30:45 (土曜日)"
+        assert isinstance(result, str)
+        assert result == "2025-03-15 14:30:45 (土曜日)"
 
     def test_time_tool_is_reusable(self) -> None:
         """同じツールインスタンスを複数回使用できることを確認。"""
@@ -100,9 +110,9 @@ class TestGetCurrentTimeTool:
         result3 = tool.execute(timezone="UTC")
 
         # すべて有効な時刻文字列が返されることを確認
-        datetime.strptime(result1.split(" (")[0], "%Y-%m-%d %H:%M:%S")
-        datetime.strptime(result2.split(" (")[0], "%Y-%m-%d %H:%M:%S")
-        datetime.strptime(result3.split(" (")[0], "%Y-%m-%d %H:%M:%S")
+        assert _RESULT_PATTERN.match(result1)
+        assert _RESULT_PATTERN.match(result2)
+        assert _RESULT_PATTERN.match(result3)
 
     def test_get_current_time_different_timezones_different_times(self) -> None:
         """異なるタイムゾーンで異なる時刻が返されることを確認。"""
@@ -112,10 +122,10 @@ class TestGetCurrentTimeTool:
         utc_time = tool.execute(timezone="UTC")
 
         # 両方とも有効な時刻であることを確認
-        datetime.strptime(tokyo_time.split(" (")[0], "%Y-%m-%d %H:%M:%S")
-        datetime.strptime(utc_time.split(" (")[0], "%Y-%m-%d %H:%M:%S")
+        assert _RESULT_PATTERN.match(tokyo_time)
+        assert _RESULT_PATTERN.match(utc_time)
 
-        # 同じ瞬間でも、異なるタイムゾーンでは異なる時刻表示になる可能性がある
-        # （ただし、秒単位で同時に実行されるため、完全に異なるとは限らない）
+        # 時刻を固定しているため、同じ瞬間が異なる時刻表示になる
         assert isinstance(tokyo_time, str)
         assert isinstance(utc_time, str)
+        assert tokyo_time != utc_time
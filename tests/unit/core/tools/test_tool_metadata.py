@@ -0,0 +1,37 @@
+"""各ツールのメタデータ（name/description）のユニットテスト。"""
+
+import pytest
+
+from src.core.tools.base import BaseTool
+from src.core.tools.event_search_tool import EventSearchTool
+from src.core.tools.product_search_tool import ProductSearchTool
+from src.core.tools.store_search_tool import StoreSearchTool
+from src.core.tools.time_tool import GetCurrentTimeTool
+from src.core.tools.user_profile_tool import UserProfileTool
+from src.core.tools.weather_tool import WeatherTool
+
+
+# (ツールクラス, 期待するツール名, 説明に含まれるべき語句)
+@pytest.mark.parametrize(
+    "tool_cls,expected_name,expected_terms",
+    [
+        pytest.param(EventSearchTool, "search_events", ("search_events", "SQL"), id="event_search"),
+        pytest.param(ProductSearchTool, "search_products", ("search_products", "SQL"), id="product_search"),
+        pytest.param(StoreSearchTool, "search_stores", ("search_stores", "SQL"), id="store_search"),
+        pytest.param(GetCurrentTimeTool, "get_current_time", ("タイムゾーン", "現在時刻"), id="time"),
+        pytest.param(UserProfileTool, "get_user_profile", ("get_user_profile",), id="user_profile"),
+        pytest.param(WeatherTool, "get_weather", ("天気予報", "東京"), id="weather"),
+    ],
+)
+def test_tool_metadata(tool_cls: type[BaseTool], expected_name: str, expected_terms: tuple[str, ...]) -> None:
+    """ツール名と説明が正しいことを確認（DBやAPIには接続しない）。"""
+    tool = tool_cls()
+    assert tool.name == expected_name
+    assert tool.description
+    assert all(term in tool.description for term in expected_terms)
+
+
+def test_weather_description_mentions_forecast_period() -> None:
+    """天気ツールの説明に予報期間（1週間/7日）が含まれることを確認。"""
+    desc = WeatherTool().description
+    assert "1週間" in desc or "7日" in desc
@@ -1,38 +1,43 @@
 """UserProfileToolのユニットテスト。"""
 
+from unittest.mock import patch
+
 import pytest
 
 from src.core.tools.user_profile_tool import UserProfileTool
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def user_profile_tool():
-    """UserProfileToolのフィクスチャ（user001としてログイン）。"""
+    """UserProfileToolのフィクスチャ（user001としてログイン、モジュール内で共有）。"""
     return UserProfileTool(username="user001")
 
 
-class TestUserProfileTool:
-    """UserProfileToolのテストクラス。"""
+# ログインユーザーごとの期待値
+_EXPECTED_PROFILES = {
+    "user001": {"profile_id": "user_criollo_heavy", "age": 28, "gender": "女性"},
+    "user002": {"profile_id": "user_diverse_frequent", "age": 35, "gender": "男性"},
+}
 
-    def test_tool_name(self, user_profile_tool):
-        """ツール名が正しいことを確認。"""
-        assert user_profile_tool.name == "get_user_profile"
 
-    def test_tool_description(self, user_profile_tool):
-        """ツールの説明が存在することを確認。"""
-        assert len(user_profile_tool.description) > 0
-        assert "get_user_profile" in user_profile_tool.description
+@pytest.fixture(scope="module", params=list(_EXPECTED_PROFILES))
+def logged_in_profile_tool(request):
+    """各ログインユーザーのUserProfileToolのフィクスチャ（モジュール内で共有）。"""
+    return UserProfileTool(username=request.param)
 
-    def test_execute_without_params(self, user_profile_tool):
+
+class TestUserProfileTool:
+    """UserProfileToolのテストクラス。"""
+
+    def test_execute_without_params(self, logged_in_profile_tool):
         """パラメータなしで実行した場合、ログイン中のユーザー情報を取得できることを確認。"""
-        result = user_profile_tool.execute()
+        result = logged_in_profile_tool.execute()
         # エラーがないことを確認
         assert "error" not in result
-        # user001のデータが取得できていることを確認
-        assert result["username"] == "user001"
-        assert result["profile_id"] == "user_criollo_heavy"
-        assert result["age"] == 28
-        assert result["gender"] == "女性"
+        # ログインユーザーのデータが取得できていることを確認
+        username = logged_in_profile_tool.username
+        assert result["username"] == username
+        assert {key: result[key] for key in _EXPECTED_PROFILES[username]} == _EXPECTED_PROFILES[username]
 
     def test_execute_result_structure(self, user_profile_tool):
         """結果の構造が正しいことを確認（5つのキーが存在）。"""
@@ -40,15 +45,8 @@ class TestUserProfileTool:
         # エラーがないことを確認
         assert "error" not in result
         # 5つのカラムが全て存在することを確認
-        expected_keys = [
-            "username",
-            "profile_id",
-            "age",
-            "gender",
-            "preferences",
-        ]
-        for key in expected_keys:
-            assert key in result, f"Expected key '{key}' not found in result"
+        expected_keys = {"username", "profile_id", "age", "gender", "preferences"}
+        assert expected_keys <= result.keys(), f"Missing keys: {expected_keys - result.keys()}"
 
     def test_execute_preferences_field(self, user_profile_tool):
         """preferencesフィールドが文字列で取得できることを確認。"""
@@ -77,18 +75,6 @@ class TestUserProfileTool:
         # preferencesにキーワードが含まれることを確認
         assert "チョコレート" in result["preferences"] or "洋菓子" in result["preferences"]
 
-    def test_execute_user002(self):
-        """user002でログインした場合の動作を確認。"""
-        tool = UserProfileTool(username="user002")
-        result = tool.execute()
-        # エラーがないことを確認
-        assert "error" not in result
-        # user002のデータが取得できていることを確認
-        assert result["username"] == "user002"
-        assert result["profile_id"] == "user_diverse_frequent"
-        assert result["age"] == 35
-        assert result["gender"] == "男性"
-
     def test_execute_without_login(self):
         """ログインしていない場合のエラー処理を確認。"""
         tool = UserProfileTool()  # usernameなし
@@ -105,3 +91,16 @@ class TestUserProfileTool:
         assert isinstance(result, dict)
         # profile_idが1つだけであることを確認
         assert result["profile_id"] == "user_criollo_heavy"
+
+    def test_execute_reads_profile_once(self):
+        """同じツールでの2回目以降の取得はキャッシュから返されることを確認。"""
+        tool = UserProfileTool(username="user001")
+        with patch.object(tool, "_fetch_user_profile_by_username", wraps=tool._fetch_user_profile_by_username) as fetch:
+            first = tool.execute()
+            second = tool.execute()
+
+        assert fetch.call_count == 1
+        assert first == second
+        # 返り値を変更してもキャッシュには影響しない
+        first["age"] = 0
+        assert tool.execute()["age"] == 28
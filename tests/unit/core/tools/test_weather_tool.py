@@ -1,145 +1,132 @@
 """WeatherToolのユニットテスト。"""
 
-from unittest.mock import Mock, patch
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Any, Optional
 
+import orjson
 import pytest
+import requests
 
 from src.core.tools.weather_tool import WeatherTool
 
+_TOKYO_FORECAST_URL = "https://www.jma.go.jp/bosai/forecast/data/forecast/130000.json"
 
-class TestWeatherTool:
-    """WeatherToolのテスト。"""
 
-    def test_tool_name(self) -> None:
-        """ツール名が正しいことを確認。"""
-        tool = WeatherTool()
-        assert tool.name == "get_weather"
+class _StubResponse:
+    """requests.Responseの代わりに使う軽量スタブ（raise_for_statusとcontentのみ実装）。"""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: Any) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        """成功レスポンスのため何もしない。"""
+
+    @property
+    def content(self) -> bytes:
+        """登録されたペイロードをJSONバイト列として返す（バイト列はそのまま返す）。"""
+        if isinstance(self._payload, bytes):
+            return self._payload
+        # 読み取り専用のMappingProxyTypeはdictに変換してシリアライズする
+        return orjson.dumps(self._payload, default=dict)
+
+
+class _StubJmaApi:
+    """requests.getの代わりに使う気象庁APIスタブ（URLごとに登録したレスポンスを返す）。"""
+
+    def __init__(self) -> None:
+        self.payloads: dict[str, Any] = {}
+        self.error: Optional[Exception] = None
+        self.calls: list[str] = []
 
-    def test_tool_description(self) -> None:
-        """ツールの説明が正しいことを確認。"""
-        tool = WeatherTool()
-        assert "天気予報" in tool.description
-        assert "東京" in tool.description
-        assert "1週間" in tool.description or "7日" in tool.description
-        assert tool.description != ""
+    def __call__(self, url: str, timeout: Optional[float] = None) -> _StubResponse:
+        self.calls.append(url)
+        if self.error is not None:
+            raise self.error
+        if url not in self.payloads:
+            raise requests.exceptions.HTTPError(f"404 Client Error: {url}")
+        return _StubResponse(self.payloads[url])
+
+
+@pytest.fixture(scope="module")
+def weather_tool() -> WeatherTool:
+    """WeatherToolのフィクスチャ（状態を持たないため、モジュール内で共有）。"""
+    return WeatherTool()
+
+
+@pytest.fixture
+def jma_api(monkeypatch: pytest.MonkeyPatch) -> _StubJmaApi:
+    """requests.getを気象庁APIスタブに差し替える（各テストは必要なレスポンスやエラーだけ設定する）。"""
+    stub = _StubJmaApi()
+    monkeypatch.setattr(requests, "get", stub)
+    return stub
+
+
+class TestWeatherTool:
+    """WeatherToolのテスト。"""
 
-    def test_get_area_code_tokyo(self) -> None:
+    def test_get_area_code_tokyo(self, weather_tool: WeatherTool) -> None:
         """東京の地域コードが正しく取得できることを確認。"""
-        tool = WeatherTool()
-        area_code = tool._get_area_code("東京")
+        area_code = weather_tool._get_area_code("東京")
         assert area_code == "130000"
 
-    def test_get_area_code_unsupported_city(self) -> None:
+    def test_get_area_code_unsupported_city(self, weather_tool: WeatherTool) -> None:
         """未対応の都市でValueErrorが発生することを確認。"""
-        tool = WeatherTool()
         with pytest.raises(ValueError) as exc_info:
-            tool._get_area_code("大阪")
+            weather_tool._get_area_code("大阪")
         assert "サポートされていません" in str(exc_info.value)
 
-    def test_execute_without_location(self) -> None:
+    def test_get_area_code_uses_overridden_area_codes(self) -> None:
+        """サブクラスでAREA_CODESを差し替えた場合、その対応表が使われることを確認。"""
+
+        class OsakaWeatherTool(WeatherTool):
+            AREA_CODES = MappingProxyType({"大阪": "270000"})
+
+        tool = OsakaWeatherTool()
+        assert tool._get_area_code("大阪") == "270000"
+        with pytest.raises(ValueError):
+            tool._get_area_code("東京")
+
+    def test_execute_without_location(self, weather_tool: WeatherTool) -> None:
         """都市名なしでエラーが返されることを確認。"""
-        tool = WeatherTool()
-        result = tool.execute()
+        result = weather_tool.execute()
         assert "error" in result
         assert "都市名" in result["error"]
 
-    @patch("requests.get")
-    def test_fetch_weather_data_success(self, mock_get: Mock) -> None:
+    def test_fetch_weather_data_success(self, jma_api: _StubJmaApi, weather_tool: WeatherTool) -> None:
         """気象庁APIからデータを正常に取得できることを確認。"""
-        # モックレスポンスを設定
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        jma_api.payloads[_TOKYO_FORECAST_URL] = [
             {"publishingOffice": "気象庁", "timeSeries": []},
             {"publishingOffice": "気象庁", "timeSeries": []},
         ]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
 
-        tool = WeatherTool()
-        data = tool._fetch_weather_data("130000")
+        data = weather_tool._fetch_weather_data("130000")
 
         # APIが呼ばれたことを確認
-        mock_get.assert_called_once()
-        assert "https://www.jma.go.jp/bosai/forecast/data/forecast/130000.json" in mock_get.call_args[0][0]
+        assert jma_api.calls == [_TOKYO_FORECAST_URL]
         assert isinstance(data, list)
 
-    @patch("requests.get")
-    def test_fetch_weather_data_timeout(self, mock_get: Mock) -> None:
+    def test_fetch_weather_data_timeout(self, jma_api: _StubJmaApi, weather_tool: WeatherTool) -> None:
         """API接続がタイムアウトした場合にExceptionが発生することを確認。"""
-        import requests
-
-        mock_get.side_effect = requests.exceptions.Timeout()
+        jma_api.error = requests.exceptions.Timeout()
 
-        tool = WeatherTool()
         with pytest.raises(Exception) as exc_info:
-            tool._fetch_weather_data("130000")
+            weather_tool._fetch_weather_data("130000")
         assert "タイムアウト" in str(exc_info.value)
 
-    def test_parse_weather_info(self) -> None:
-        """天気データの解析が正しく行われることを確認。"""
-        # 実際のAPIレスポンスに近いモックデータ
-        mock_data = [
-            # data[0]: 詳細予報（3日分）
-            {
-                "publishingOffice": "気象庁",
-                "reportDatetime": "2025-10-21T11:00:00+09:00",
-                "timeSeries": [
-                    {
-                        "timeDefines": [
-                            "2025-10-22T00:00:00+09:00",
-                            "2025-10-23T00:00:00+09:00",
-                            "2025-10-24T00:00:00+09:00",
-                        ],
-                        "areas": [
-                            {
-                                "area": {"name": "東京地方", "code": "130010"},
-                                "weathers": ["くもり　夜　雨", "雨　昼前　から　くもり", "くもり　時々　晴れ"],
-                            }
-                        ],
-                    }
-                ],
-            },
-            # data[1]: 週間予報（7日分）
-            {
-                "publishingOffice": "気象庁",
-                "reportDatetime": "2025-10-21T11:00:00+09:00",
-                "timeSeries": [
-                    {
-                        "timeDefines": [
-                            "2025-10-22T00:00:00+09:00",
-                            "2025-10-23T00:00:00+09:00",
-                            "2025-10-24T00:00:00+09:00",
-                            "2025-10-25T00:00:00+09:00",
-                            "2025-10-26T00:00:00+09:00",
-                            "2025-10-27T00:00:00+09:00",
-                            "2025-10-28T00:00:00+09:00",
-                        ],
-                        "areas": [{"area": {"name": "東京地方", "code": "130010"}}],
-                    },
-                    {
-                        "timeDefines": [
-                            "2025-10-22T00:00:00+09:00",
-                            "2025-10-23T00:00:00+09:00",
-                            "2025-10-24T00:00:00+09:00",
-                            "2025-10-25T00:00:00+09:00",
-                            "2025-10-26T00:00:00+09:00",
-                            "2025-10-27T00:00:00+09:00",
-                            "2025-10-28T00:00:00+09:00",
-                        ],
-                        "areas": [
-                            {
-                                "area": {"name": "東京", "code": "44132"},
-                                "tempsMin": ["", "12", "12", "12", "14", "16", "14"],
-                                "tempsMax": ["", "19", "20", "20", "19", "22", "20"],
-                            }
-                        ],
-                    },
-                ],
-            },
-        ]
+    def test_fetch_weather_data_invalid_json(self, jma_api: _StubJmaApi, weather_tool: WeatherTool) -> None:
+        """JSONとして解析できないレスポンスでExceptionが発生することを確認。"""
+        jma_api.payloads[_TOKYO_FORECAST_URL] = b"<html>maintenance</html>"
+
+        with pytest.raises(Exception) as exc_info:
+            weather_tool._fetch_weather_data("130000")
+        assert "解析に失敗" in str(exc_info.value)
 
-        tool = WeatherTool()
-        result = tool._parse_weather_info(mock_data, "東京", "130000")
+    def test_parse_weather_info(self, weather_tool: WeatherTool, tokyo_forecast_payload: Sequence[Any]) -> None:
+        """天気データの解析が正しく行われることを確認。"""
+        result = weather_tool._parse_weather_info(tokyo_forecast_payload, "東京", "130000")
 
         # 基本情報の確認
         assert result["location"] == "東京"
@@ -161,67 +148,31 @@ class TestWeatherTool:
         assert forecast[1]["temperature"]["min"] == "12"
         assert forecast[1]["temperature"]["max"] == "19"
 
-    def test_simplify_weather_text_basic(self) -> None:
+    @pytest.mark.parametrize(
+        "weather,expected",
+        [
+            # 基本的な置換
+            pytest.param("くもり", "曇り", id="kumori"),
+            pytest.param("はれ", "晴れ", id="hare"),
+            # 時間帯情報の削除
+            pytest.param("くもり　夜　雨", "曇り時々雨", id="drop_time_keyword"),
+            # 「から」→「のち」
+            pytest.param("雨　昼前　から　くもり", "雨のち曇り", id="kara_to_nochi"),
+            pytest.param("くもり　時々　晴れ", "曇り時々晴れ", id="tokidoki"),
+            pytest.param("", "", id="empty"),
+        ],
+    )
+    def test_simplify_weather_text(self, weather_tool: WeatherTool, weather: str, expected: str) -> None:
         """天気テキストの簡潔化が正しく行われることを確認。"""
-        tool = WeatherTool()
-
-        # 基本的な置換
-        assert "曇り" in tool._simplify_weather_text("くもり")
-        assert "晴れ" in tool._simplify_weather_text("はれ")
-
-        # 時間帯情報の削除
-        result = tool._simplify_weather_text("くもり　夜　雨")
-        assert "曇り" in result
-        assert "雨" in result
-
-        # 「から」→「のち」
-        result = tool._simplify_weather_text("雨　昼前　から　くもり")
-        assert "のち" in result or ("雨" in result and "曇り" in result)
+        assert weather_tool._simplify_weather_text(weather) == expected
 
-    def test_simplify_weather_text_empty(self) -> None:
-        """空の天気テキストが正しく処理されることを確認。"""
-        tool = WeatherTool()
-        assert tool._simplify_weather_text("") == ""
-
-    @patch("requests.get")
-    def test_execute_success(self, mock_get: Mock) -> None:
+    def test_execute_success(
+        self, jma_api: _StubJmaApi, weather_tool: WeatherTool, tokyo_forecast_payload: Sequence[Any]
+    ) -> None:
         """execute()が正常に動作することを確認。"""
-        # モックレスポンスを設定
-        mock_response = Mock()
-        mock_response.json.return_value = [
-            {
-                "publishingOffice": "気象庁",
-                "reportDatetime": "2025-10-21T11:00:00+09:00",
-                "timeSeries": [
-                    {
-                        "timeDefines": ["2025-10-22T00:00:00+09:00"],
-                        "areas": [{"area": {"name": "東京地方", "code": "130010"}, "weathers": ["晴れ"]}],
-                    }
-                ],
-            },
-            {
-                "publishingOffice": "気象庁",
-                "reportDatetime": "2025-10-21T11:00:00+09:00",
-                "timeSeries": [
-                    {"timeDefines": ["2025-10-22T00:00:00+09:00"], "areas": []},
-                    {
-                        "timeDefines": ["2025-10-22T00:00:00+09:00"],
-                        "areas": [
-                            {
-                                "area": {"name": "東京", "code": "44132"},
-                                "tempsMin": ["12"],
-                                "tempsMax": ["20"],
-                            }
-                        ],
-                    },
-                ],
-            },
-        ]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        jma_api.payloads[_TOKYO_FORECAST_URL] = tokyo_forecast_payload
 
-        tool = WeatherTool()
-        result = tool.execute(location="東京")
+        result = weather_tool.execute(location="東京")
 
         # エラーがないことを確認
         assert "error" not in result
@@ -229,42 +180,34 @@ class TestWeatherTool:
         assert "forecast" in result
         assert len(result["forecast"]) > 0
 
-    @patch("requests.get")
-    def test_execute_unsupported_city(self, mock_get: Mock) -> None:
+    def test_execute_unsupported_city(self, jma_api: _StubJmaApi, weather_tool: WeatherTool) -> None:
         """未対応の都市でエラーが返されることを確認。"""
-        tool = WeatherTool()
-        result = tool.execute(location="大阪")
+        result = weather_tool.execute(location="大阪")
 
         # エラーが返されることを確認
         assert "error" in result
         assert "サポートされていません" in result["error"]
 
         # APIが呼ばれていないことを確認
-        mock_get.assert_not_called()
+        assert jma_api.calls == []
 
-    @patch("requests.get")
-    def test_execute_api_error(self, mock_get: Mock) -> None:
+    def test_execute_api_error(self, jma_api: _StubJmaApi, weather_tool: WeatherTool) -> None:
         """API接続エラー時にエラーが返されることを確認。"""
-        import requests
+        jma_api.error = requests.exceptions.ConnectionError("Connection failed")
 
-        mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
-
-        tool = WeatherTool()
-        result = tool.execute(location="東京")
+        result = weather_tool.execute(location="東京")
 
         # エラーが返されることを確認
         assert "error" in result
         assert "取得に失敗" in result["error"]
 
-    def test_tool_is_reusable(self) -> None:
+    def test_tool_is_reusable(self, weather_tool: WeatherTool) -> None:
         """同じツールインスタンスを複数回使用できることを確認。"""
-        tool = WeatherTool()
-
         # 複数回呼び出し可能
-        name1 = tool.name
-        name2 = tool.name
+        name1 = weather_tool.name
+        name2 = weather_tool.name
         assert name1 == name2 == "get_weather"
 
-        desc1 = tool.description
-        desc2 = tool.description
+        desc1 = weather_tool.description
+        desc2 = weather_tool.description
         assert desc1 == desc2
@@ -0,0 +1,21 @@
+"""ユーティリティのユニットテストで共有するフィクスチャ。"""
+
+import logging
+from collections.abc import Iterator
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cleanup_loggers() -> Iterator[None]:
+    """テスト中に作成されたロガーを終了時にloggerDictから削除し、テスト間で状態を持ち越さないようにする。"""
+    logger_dict = logging.Logger.manager.loggerDict
+    existing = set(logger_dict)
+    yield
+    for name in set(logger_dict) - existing:
+        logger = logger_dict.pop(name)
+        # PlaceHolderはハンドラーを持たない
+        if isinstance(logger, logging.Logger):
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+                handler.close()
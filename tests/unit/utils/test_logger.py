@@ -1,7 +1,7 @@
 """ロガー設定モジュールのユニットテスト"""
 
 import logging
-from io import StringIO
+import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,63 +9,68 @@ import pytest
 from src.utils.logger import get_logger, setup_logger
 
 
+@pytest.fixture
+def logger_name() -> str:
+    """テストごとに一意なロガー名（同名ロガーのハンドラーがテスト間で残らないようにする）。"""
+    return f"test_logger_{uuid.uuid4().hex}"
+
+
 class TestSetupLogger:
     """setup_logger関数のテストスイート"""
 
-    def test_setup_logger_with_default_params(self) -> None:
+    def test_setup_logger_with_default_params(self, logger_name: str) -> None:
         """デフォルトパラメータでのロガー設定をテスト"""
-        logger = setup_logger("test_logger")
+        logger = setup_logger(logger_name)
 
-        assert logger.name == "test_logger"
+        assert logger.name == logger_name
         assert logger.level == logging.INFO
         assert len(logger.handlers) == 1
         assert isinstance(logger.handlers[0], logging.StreamHandler)
 
-    def test_setup_logger_with_custom_level(self) -> None:
+    def test_setup_logger_with_custom_level(self, logger_name: str) -> None:
         """カスタムログレベルでのロガー設定をテスト"""
-        logger = setup_logger("test_logger_debug", level="DEBUG")
+        logger = setup_logger(logger_name, level="DEBUG")
 
         assert logger.level == logging.DEBUG
         assert logger.handlers[0].level == logging.DEBUG
 
-    def test_setup_logger_with_custom_format(self) -> None:
+    def test_setup_logger_with_custom_format(self, logger_name: str) -> None:
         """カスタムフォーマット文字列でのロガー設定をテスト"""
         custom_format = "%(levelname)s - %(message)s"
-        logger = setup_logger("test_logger_format", format_str=custom_format)
+        logger = setup_logger(logger_name, format_str=custom_format)
 
         formatter = logger.handlers[0].formatter
         assert formatter is not None
         assert formatter._fmt == custom_format
 
-    def test_setup_logger_handles_invalid_level(self) -> None:
+    def test_setup_logger_handles_invalid_level(self, logger_name: str) -> None:
         """無効なログレベルでのロガー設定がINFOにデフォルト設定されることをテスト"""
-        logger = setup_logger("test_logger_invalid", level="INVALID")
+        logger = setup_logger(logger_name, level="INVALID")
 
         assert logger.level == logging.INFO
 
-    def test_setup_logger_no_duplicate_handlers(self) -> None:
+    def test_setup_logger_no_duplicate_handlers(self, logger_name: str) -> None:
         """setup_loggerを2回呼び出しても重複ハンドラーが作成されないことをテスト"""
-        logger1 = setup_logger("test_logger_duplicate")
+        logger1 = setup_logger(logger_name)
         initial_handler_count = len(logger1.handlers)
 
-        logger2 = setup_logger("test_logger_duplicate")
+        logger2 = setup_logger(logger_name)
         assert logger1 is logger2
         assert len(logger2.handlers) == initial_handler_count
 
-    def test_logger_output_to_stdout(self) -> None:
+    def test_logger_output_to_stdout(self, logger_name: str, capsys: pytest.CaptureFixture[str]) -> None:
         """ロガーが標準出力に出力することをテスト"""
         test_message = "Test log message"
 
-        with patch("sys.stdout", new=StringIO()) as fake_stdout:
-            logger = setup_logger("test_stdout_logger", level="INFO")
-            logger.info(test_message)
+        # capsysが差し替えたsys.stdoutにハンドラーが紐づくよう、テスト内でロガーを作成する
+        logger = setup_logger(logger_name, level="INFO")
+        logger.info(test_message)
 
-            output = fake_stdout.getvalue()
-            assert test_message in output
+        assert test_message in capsys.readouterr().out
 
-    def test_logger_no_propagation(self) -> None:
+    def test_logger_no_propagation(self, logger_name: str) -> None:
         """ロガーの伝播が無効化されていることをテスト"""
-        logger = setup_logger("test_no_propagate")
+        logger = setup_logger(logger_name)
         assert logger.propagate is False
 
 
@@ -103,38 +108,37 @@ class TestGetLogger:
 class TestLoggerIntegration:
     """ロガー機能の統合テスト"""
 
-    def test_logger_different_levels(self) -> None:
+    def test_logger_different_levels(self, logger_name: str, caplog: pytest.LogCaptureFixture) -> None:
         """ロガーがレベルに応じてメッセージを正しくフィルタリングすることをテスト"""
-        with patch("sys.stdout", new=StringIO()) as fake_stdout:
-            logger = setup_logger("test_levels", level="WARNING")
-
-            logger.debug("Debug message")
-            logger.info("Info message")
-            logger.warning("Warning message")
-            logger.error("Error message")
+        logger = setup_logger(logger_name, level="WARNING")
+        # propagate=Falseのためルートのcaplogには届かない。キャプチャ用ハンドラーを直接追加する
+        logger.addHandler(caplog.handler)
 
-            output = fake_stdout.getvalue()
+        logger.debug("Debug message")
+        logger.info("Info message")
+        logger.warning("Warning message")
+        logger.error("Error message")
 
-            assert "Debug message" not in output
-            assert "Info message" not in output
-            assert "Warning message" in output
-            assert "Error message" in output
+        assert [record.getMessage() for record in caplog.records] == ["Warning message", "Error message"]
 
-    def test_logger_format_includes_components(self) -> None:
+    def test_logger_format_includes_components(self, logger_name: str, caplog: pytest.LogCaptureFixture) -> None:
         """デフォルトフォーマットに期待されるすべてのコンポーネントが含まれることをテスト"""
-        with patch("sys.stdout", new=StringIO()) as fake_stdout:
-            logger = setup_logger(
-                "test_format_components",
-                level="INFO",
-                format_str="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            )
+        logger = setup_logger(
+            logger_name,
+            level="INFO",
+            format_str="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
+        logger.addHandler(caplog.handler)
 
-            logger.info("Test message")
-            output = fake_stdout.getvalue()
+        logger.info("Test message")
 
-            assert "test_format_components" in output
-            assert "INFO" in output
-            assert "Test message" in output
+        # キャプチャしたレコードをロガー自身のフォーマッターで整形して確認する
+        formatter = logger.handlers[0].formatter
+        assert formatter is not None
+        output = formatter.format(caplog.records[0])
+        assert logger_name in output
+        assert "INFO" in output
+        assert "Test message" in output
 
     def test_multiple_loggers_independent(self) -> None:
         """複数のロガーが独立していることをテスト"""